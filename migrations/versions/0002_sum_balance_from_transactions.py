@@ -0,0 +1,50 @@
+"""Sum balances from transactions
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 21:40:12.418233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_transactions_owner_income_amount',
+        'transactions',
+        ['owner_id', 'is_income', 'amount'],
+        unique=False,
+    )
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('balance')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('balance', sa.Integer(), server_default='0', nullable=False)
+        )
+    # Restore the stored balances from the transactions they summarize
+    op.execute(
+        """
+        UPDATE users SET balance = COALESCE((
+            SELECT SUM(CASE WHEN transactions.is_income THEN transactions.amount
+                            ELSE -transactions.amount END)
+            FROM transactions
+            WHERE transactions.owner_id = users.id
+        ), 0)
+        """
+    )
+    op.drop_index('ix_transactions_owner_income_amount', table_name='transactions')
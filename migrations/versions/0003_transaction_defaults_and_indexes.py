@@ -0,0 +1,81 @@
+"""Transaction defaults and indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 22:05:37.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from ai_worthy_api_roo_1.database.models import epoch_ms
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Millisecond timestamps and large cent amounts overflow a 32-bit integer
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.alter_column(
+            'amount',
+            existing_type=sa.Integer(),
+            type_=sa.BigInteger(),
+            existing_nullable=False,
+        )
+        batch_op.alter_column(
+            'created_at',
+            existing_type=sa.Integer(),
+            type_=sa.BigInteger(),
+            server_default=epoch_ms(),
+            existing_nullable=False,
+        )
+    op.create_index(
+        'ix_transactions_owner_created_id',
+        'transactions',
+        ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['currency', 'amount', 'is_income'],
+    )
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'ix_transactions_description_trgm',
+            'transactions',
+            ['description'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+        )
+    op.create_index('ix_tags_transaction_id_text', 'tags', ['transaction_id', 'text'], unique=False)
+    op.create_index('ix_tags_user_id_text', 'tags', ['user_id', 'text'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tags_user_id_text', table_name='tags')
+    op.drop_index('ix_tags_transaction_id_text', table_name='tags')
+    if op.get_context().dialect.name == 'postgresql':
+        op.drop_index('ix_transactions_description_trgm', table_name='transactions')
+    op.drop_index('ix_transactions_owner_created_id', table_name='transactions')
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.alter_column(
+            'created_at',
+            existing_type=sa.BigInteger(),
+            type_=sa.Integer(),
+            server_default=None,
+            existing_nullable=False,
+        )
+        batch_op.alter_column(
+            'amount',
+            existing_type=sa.BigInteger(),
+            type_=sa.Integer(),
+            existing_nullable=False,
+        )
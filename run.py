@@ -1,12 +1,24 @@
 #!/usr/bin/env python
 """Run script for the Financial Tracking API."""
 
+import os
+
 import uvicorn
+from alembic import command
+from alembic.config import Config
 
 if __name__ == "__main__":
+    # Apply migrations once here rather than in every worker
+    command.upgrade(Config(os.path.join(os.path.dirname(__file__), "alembic.ini")), "head")
+    
+    # One process per worker; on Kubernetes run WEB_CONCURRENCY=1 per
+    # container and scale with replicas instead
     uvicorn.run(
         "src.ai_worthy_api_roo_1.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
     )
\ No newline at end of file
@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+"""Development run script for the Financial Tracking API (auto-reload)."""
+
+import os
+
+import uvicorn
+from alembic import command
+from alembic.config import Config
+
+if __name__ == "__main__":
+    # Apply migrations once here rather than on every reload
+    command.upgrade(Config(os.path.join(os.path.dirname(__file__), "alembic.ini")), "head")
+    
+    uvicorn.run(
+        "src.ai_worthy_api_roo_1.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+    )
\ No newline at end of file
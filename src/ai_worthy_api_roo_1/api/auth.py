@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from ai_worthy_api_roo_1.dependencies import get_auth_service
@@ -28,13 +28,18 @@ async def login_for_access_token(
     Returns:
         Access token.
     """
-    user = await auth_service.authenticate_user(form_data.username, form_data.password)
+    user_id = await auth_service.authenticate_user_id(
+        form_data.username, form_data.password
+    )
     
-    if not user:
-        # The exception is raised in the service
-        pass
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
-    return await auth_service.create_access_token_for_user(user.id)
+    return await auth_service.create_access_token_for_user(user_id)
 
 
 @router.post("/login", response_model=UserOut)
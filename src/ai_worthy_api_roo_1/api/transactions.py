@@ -1,79 +1,181 @@
 """Transaction-related API endpoints."""
 
-from typing import Any, List, Optional
+import csv
+import io
+from typing import Any, AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
-from ai_worthy_api_roo_1.database.models import User
+from ai_worthy_api_roo_1.core.pagination import decode_cursor, encode_cursor
 from ai_worthy_api_roo_1.dependencies import get_transaction_service
-from ai_worthy_api_roo_1.middleware.auth import get_current_user
+from ai_worthy_api_roo_1.middleware.auth import get_current_user_id
 from ai_worthy_api_roo_1.schemas.transaction import TransactionCreate, TransactionFilter, TransactionOut
 from ai_worthy_api_roo_1.services.transaction_service import TransactionService
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+# Columns of the CSV export
+CSV_COLUMNS = ("id", "created_at", "description", "amount", "currency", "is_income", "tags")
+
 
 @router.get("/recent", response_model=List[TransactionOut])
 async def get_recent_transactions(
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
     transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> Any:
     """
     Get the three most recent transactions.
     
     Args:
-        current_user: The authenticated user.
+        current_user_id: The authenticated user's ID.
         transaction_service: Transaction service.
         
     Returns:
         List of recent transactions.
     """
-    return await transaction_service.get_recent_transactions(current_user.id)
+    return await transaction_service.get_recent_transactions(current_user_id)
+
+
+async def transactions_csv(batches: AsyncIterator[List[TransactionOut]]) -> AsyncIterator[str]:
+    """
+    Render batches of transactions as CSV, one chunk per batch.
+    
+    Args:
+        batches: Batches of transactions.
+        
+    Yields:
+        The header line, then the lines of each batch.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue()
+    
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            (
+                transaction.id,
+                transaction.created_at,
+                transaction.description,
+                transaction.amount,
+                transaction.currency,
+                transaction.is_income,
+                ";".join(transaction.tags),
+            )
+            for transaction in batch
+        )
+        yield buffer.getvalue()
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_transactions(
+    description: Optional[str] = None,
+    start_date: Optional[int] = None,
+    end_date: Optional[int] = None,
+    tags: List[str] = Query(None),
+    current_user_id: int = Depends(get_current_user_id),
+    transaction_service: TransactionService = Depends(get_transaction_service)
+) -> StreamingResponse:
+    """
+    Export all transactions matching the filters as CSV.
+    
+    The file is streamed while the transactions are read, so memory use
+    does not grow with the number of transactions.
+    
+    Args:
+        description: Optional filter for transaction description.
+        start_date: Optional filter for minimum creation date (unix timestamp ms).
+        end_date: Optional filter for maximum creation date (unix timestamp ms).
+        tags: Optional list of tags to filter by.
+        current_user_id: The authenticated user's ID.
+        transaction_service: Transaction service.
+        
+    Returns:
+        A CSV file of transactions, newest first.
+    """
+    filters = TransactionFilter(
+        description=description,
+        start_date=start_date,
+        end_date=end_date,
+        tags=tags,
+    )
+    
+    return StreamingResponse(
+        transactions_csv(transaction_service.export_transactions(current_user_id, filters)),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="transactions.csv"'},
+    )
 
 
 @router.get("/", response_model=List[TransactionOut])
 async def get_transactions(
-    page: int = 1,
+    response: Response,
+    page: int = Query(1, deprecated=True),
     per_page: int = 10,
     description: Optional[str] = None,
     start_date: Optional[int] = None,
     end_date: Optional[int] = None,
     tags: List[str] = Query(None),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = None,
+    current_user_id: int = Depends(get_current_user_id),
     transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> Any:
     """
     Get a paginated list of transactions with optional filters.
     
+    When a full page is returned, the cursor for the next page is sent in
+    the X-Next-Cursor response header.
+    
     Args:
-        page: The page number (1-indexed).
+        response: The outgoing response.
+        page: The page number (1-indexed); ignored when a cursor is given.
+            Deprecated in favour of cursor.
         per_page: Number of items per page.
         description: Optional filter for transaction description.
         start_date: Optional filter for minimum creation date (unix timestamp ms).
         end_date: Optional filter for maximum creation date (unix timestamp ms).
         tags: Optional list of tags to filter by.
-        current_user: The authenticated user.
+        cursor: Optional cursor from a previous X-Next-Cursor header.
+        current_user_id: The authenticated user's ID.
         transaction_service: Transaction service.
         
     Returns:
         List of transactions.
     """
+    try:
+        decoded_cursor = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    
     filters = TransactionFilter(
         page=page,
         per_page=per_page,
         description=description,
         start_date=start_date,
         end_date=end_date,
-        tags=tags
+        tags=tags,
+        cursor=decoded_cursor
     )
     
-    return await transaction_service.get_transactions(current_user.id, filters)
+    transactions = await transaction_service.get_transactions(current_user_id, filters)
+    
+    if len(transactions) == filters.per_page:
+        last = transactions[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    
+    return transactions
 
 
 @router.post("/", response_model=bool)
 async def create_transaction(
     transaction_data: TransactionCreate,
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
     transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> Any:
     """
@@ -81,19 +183,19 @@ async def create_transaction(
     
     Args:
         transaction_data: Transaction information.
-        current_user: The authenticated user.
+        current_user_id: The authenticated user's ID.
         transaction_service: Transaction service.
         
     Returns:
         True if transaction was created successfully.
     """
-    return await transaction_service.create_transaction(transaction_data, current_user.id)
+    return await transaction_service.create_transaction(transaction_data, current_user_id)
 
 
 @router.get("/{transaction_id}", response_model=Optional[TransactionOut])
 async def get_transaction(
     transaction_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
     transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> Any:
     """
@@ -101,19 +203,19 @@ async def get_transaction(
     
     Args:
         transaction_id: The ID of the transaction.
-        current_user: The authenticated user.
+        current_user_id: The authenticated user's ID.
         transaction_service: Transaction service.
         
     Returns:
         Transaction information or None if not found.
     """
-    return await transaction_service.get_transaction(transaction_id, current_user.id)
+    return await transaction_service.get_transaction(transaction_id, current_user_id)
 
 
 @router.delete("/{transaction_id}", response_model=bool)
 async def delete_transaction(
     transaction_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
     transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> Any:
     """
@@ -121,10 +223,10 @@ async def delete_transaction(
     
     Args:
         transaction_id: The ID of the transaction.
-        current_user: The authenticated user.
+        current_user_id: The authenticated user's ID.
         transaction_service: Transaction service.
         
     Returns:
         True if transaction was deleted, False otherwise.
     """
-    return await transaction_service.delete_transaction(transaction_id, current_user.id)
\ No newline at end of file
+    return await transaction_service.delete_transaction(transaction_id, current_user_id)
\ No newline at end of file
@@ -5,8 +5,7 @@ from typing import Any
 from fastapi import APIRouter, Depends
 
 from ai_worthy_api_roo_1.dependencies import get_user_service
-from ai_worthy_api_roo_1.database.models import User
-from ai_worthy_api_roo_1.middleware.auth import get_current_user
+from ai_worthy_api_roo_1.middleware.auth import get_current_user, get_current_user_id
 from ai_worthy_api_roo_1.schemas.user import UserBalance, UserOut
 from ai_worthy_api_roo_1.services.user_service import UserService
 
@@ -15,13 +14,13 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 @router.get("/me", response_model=UserOut)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: UserOut = Depends(get_current_user)
 ) -> Any:
     """
     Get current user profile information.
     
     Args:
-        current_user: The authenticated user.
+        current_user: The authenticated user's profile.
         
     Returns:
         User information.
@@ -31,17 +30,17 @@ async def get_current_user_info(
 
 @router.get("/balance", response_model=UserBalance)
 async def get_user_balance(
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
     user_service: UserService = Depends(get_user_service)
 ) -> Any:
     """
     Get current user's balance.
     
     Args:
-        current_user: The authenticated user.
+        current_user_id: The authenticated user's ID.
         user_service: User service.
         
     Returns:
         User balance and currency.
     """
-    return await user_service.get_user_balance(current_user.id)
\ No newline at end of file
+    return await user_service.get_user_balance(current_user_id)
\ No newline at end of file
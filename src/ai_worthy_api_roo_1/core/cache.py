@@ -0,0 +1,73 @@
+"""In-process caching utilities."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """A size-bounded LRU cache whose entries expire after a fixed time."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Seconds an entry stays valid after it is set.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: The cache key.
+            
+        Returns:
+            The value if present and not expired, None otherwise.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used entry when full.
+        
+        Args:
+            key: The cache key.
+            value: The value to cache.
+        """
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> None:
+        """
+        Remove a cached value if present.
+        
+        Args:
+            key: The cache key.
+        """
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
\ No newline at end of file
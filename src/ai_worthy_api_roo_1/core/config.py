@@ -3,7 +3,7 @@
 import os
 from typing import Any, Dict, Optional
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,15 +32,43 @@ class Settings(BaseSettings):
     DATABASE_URL: str = Field(
         default="sqlite+aiosqlite:///./financial_tracker.db"
     )
+    # Log every SQL statement; kept separate from DEBUG as it is costly
+    DB_ECHO: bool = False
+    # Connection pool (ignored for SQLite)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 0
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    # Compiled SQL kept per engine, and prepared statements per connection
+    DB_STATEMENT_CACHE_SIZE: int = 1024
 
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = ["*"]
 
     # Extra settings
-    SALT_ROUNDS: int = 12  # For bcrypt
+    SALT_ROUNDS: int = 12  # bcrypt cost factor for new password hashes
+
+    # In-process caches (per worker; a TTL of 0 disables a cache)
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL: int = 60  # seconds
+    # Verified tokens; each hit still checks the token's own expiry
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL: int = 3600  # seconds
+    # Off by default: other workers keep serving a cached balance until it
+    # expires, so only enable with one worker or where that lag is fine
+    BALANCE_CACHE_TTL: int = 0  # seconds
 
     # Static directories
     BASE_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def use_asyncpg_for_postgres(cls, value: str) -> str:
+        """Route PostgreSQL URLs through the native asyncpg driver."""
+        for prefix in ("postgres://", "postgresql://", "postgresql+psycopg2://"):
+            if value.startswith(prefix):
+                return "postgresql+asyncpg://" + value[len(prefix):]
+        return value
+
 
 settings = Settings()
\ No newline at end of file
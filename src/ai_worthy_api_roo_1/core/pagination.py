@@ -0,0 +1,41 @@
+"""Keyset pagination cursor helpers."""
+
+import base64
+import binascii
+from typing import Tuple
+
+
+def encode_cursor(created_at: int, transaction_id: int) -> str:
+    """
+    Encode a transaction's sort key as an opaque cursor.
+    
+    Args:
+        created_at: The transaction creation time (unix timestamp ms).
+        transaction_id: The transaction ID.
+        
+    Returns:
+        The URL-safe cursor string.
+    """
+    raw = f"{created_at}:{transaction_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: The cursor string.
+        
+    Returns:
+        A tuple of (created_at, transaction_id).
+        
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, transaction_id = raw.split(":")
+        return int(created_at), int(transaction_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
\ No newline at end of file
@@ -1,15 +1,21 @@
 """Security utilities for authentication and authorization."""
 
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
 
-from jose import jwt
+import jwt
 from passlib.context import CryptContext
 from pydantic import ValidationError
 
 from ai_worthy_api_roo_1.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Key bytes for HMAC signing, encoded once rather than on every token
+SECRET_KEY_BYTES = settings.SECRET_KEY.encode()
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.SALT_ROUNDS
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -22,6 +28,12 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+@lru_cache(maxsize=1)
+def get_dummy_password_hash() -> str:
+    """Get a hash at the configured cost to verify against for unknown users."""
+    return get_password_hash("dummy-password")
+
+
 def create_access_token(
     subject: Union[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
@@ -44,6 +56,28 @@ def create_access_token(
     
     to_encode = {"exp": expire, "sub": str(subject)}
     encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        to_encode, SECRET_KEY_BYTES, algorithm=settings.ALGORITHM
     )
-    return encoded_jwt
\ No newline at end of file
+    return encoded_jwt
+
+
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT access token.
+    
+    Args:
+        token: The encoded JWT token.
+        
+    Returns:
+        The token claims.
+        
+    Raises:
+        jwt.InvalidTokenError: If the token is malformed, has a bad signature,
+            has expired or lacks the exp or sub claim.
+    """
+    return jwt.decode(
+        token,
+        SECRET_KEY_BYTES,
+        algorithms=(settings.ALGORITHM,),
+        options={"require": ["exp", "sub"]},
+    )
\ No newline at end of file
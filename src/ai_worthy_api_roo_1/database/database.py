@@ -1,14 +1,115 @@
 """Database connection and session configuration."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
+from typing import Any, Dict
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from ai_worthy_api_roo_1.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
-async_session = sessionmaker(
-    engine, expire_on_commit=False, class_=AsyncSession
+
+def get_engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Build engine options for the configured database.
+    
+    Args:
+        database_url: The database URL.
+        
+    Returns:
+        Keyword arguments for create_async_engine.
+    """
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        # Rows per multi-row INSERT when batching executemany calls
+        "insertmanyvalues_page_size": 1000,
+        # Reuse compiled SQL for the app's fixed set of parameterized queries
+        "query_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    
+    # SQLite keeps SQLAlchemy's default pool; sizing only applies to servers
+    if database_url.startswith("sqlite"):
+        return options
+    
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    
+    if database_url.startswith("postgresql+asyncpg"):
+        options["connect_args"] = {
+            # Short OLTP queries don't benefit from PostgreSQL's JIT
+            "server_settings": {"jit": "off"},
+            # Keep server-side prepared statements so repeated queries skip
+            # parse and plan
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    
+    return options
+
+
+def enable_sqlite_foreign_keys(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    Turn on foreign key enforcement for a new SQLite connection.
+    
+    SQLite ignores foreign keys, and with them ON DELETE CASCADE, unless
+    this is enabled on every connection.
+    
+    Args:
+        dbapi_connection: The DBAPI connection.
+        connection_record: The pool's connection record.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def tune_sqlite_connection(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    Configure a new SQLite connection for concurrent reads and cheap commits.
+    
+    WAL lets readers run alongside a writer, and with synchronous=NORMAL a
+    commit appends to the log without an fsync; the log is synced at
+    checkpoints instead. The journal mode persists in the database file,
+    which from then on is accompanied by -wal and -shm files.
+    
+    Args:
+        dbapi_connection: The DBAPI connection.
+        connection_record: The pool's connection record.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.close()
+
+
+engine = create_async_engine(
+    settings.DATABASE_URL, **get_engine_options(settings.DATABASE_URL)
 )
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+    event.listen(engine.sync_engine, "connect", tune_sqlite_connection)
+async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def warm_up_pool() -> None:
+    """Open the whole connection pool up front so requests never pay connect cost."""
+    if engine.dialect.name == "sqlite":
+        return
+    
+    async def ping() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    
+    # Connections must be checked out concurrently, otherwise the pool
+    # would keep handing back the same one
+    await asyncio.gather(*(ping() for _ in range(settings.DB_POOL_SIZE)))
 
 
 async def get_db() -> AsyncSession:
@@ -26,4 +127,18 @@ async def get_db() -> AsyncSession:
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+async def get_read_only_db() -> AsyncSession:
+    """
+    Get a database session for requests that only read.
+    
+    The session is closed without committing; returning the connection to
+    the pool rolls its transaction back, skipping the COMMIT round trip.
+    
+    Yields:
+        AsyncSession: A SQLAlchemy async session.
+    """
+    async with async_session() as session:
+        yield session
\ No newline at end of file
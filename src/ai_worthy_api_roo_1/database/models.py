@@ -1,12 +1,32 @@
 """SQLAlchemy models definition."""
 
-import time
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from sqlalchemy import (
-    Boolean, ForeignKey, Integer, String, Text, func
+    BigInteger, DDL, Boolean, ForeignKey, Index, Integer, String, Text, desc, event, func
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class epoch_ms(FunctionElement):
+    """The database's current time in milliseconds since the Unix epoch."""
+    
+    type = BigInteger()
+    inherit_cache = True
+
+
+@compiles(epoch_ms)
+def _compile_epoch_ms(element: epoch_ms, compiler: Any, **kw: Any) -> str:
+    """Compile epoch_ms for SQLite, keeping the millisecond part."""
+    return "CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)"
+
+
+@compiles(epoch_ms, "postgresql")
+def _compile_epoch_ms_postgresql(element: epoch_ms, compiler: Any, **kw: Any) -> str:
+    """Compile epoch_ms for PostgreSQL."""
+    return "(extract(epoch from clock_timestamp()) * 1000)::bigint"
 
 
 class Base(DeclarativeBase):
@@ -23,7 +43,6 @@ class User(Base):
     username: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     password: Mapped[str] = mapped_column(String, nullable=False)
     image: Mapped[str] = mapped_column(String, nullable=False)
-    balance: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     primary_currency: Mapped[str] = mapped_column(
         String, default="BYN", nullable=False
     )
@@ -41,15 +60,37 @@ class Transaction(Base):
     """Transaction model."""
     
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Serves per-owner listing in (created_at, id) order, incl. keyset pages.
+        # On PostgreSQL the small fixed-size columns are included; the
+        # unbounded description is left out so it can't exceed the btree
+        # entry size limit.
+        Index(
+            "ix_transactions_owner_created_id",
+            "owner_id",
+            desc("created_at"),
+            desc("id"),
+            postgresql_include=["currency", "amount", "is_income"],
+        ),
+        # Covers the per-owner balance aggregation without reading the table
+        Index("ix_transactions_owner_income_amount", "owner_id", "is_income", "amount"),
+        # Trigram index backing the ILIKE description search (PostgreSQL only)
+        Index(
+            "ix_transactions_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     currency: Mapped[str] = mapped_column(String, nullable=False)
-    amount: Mapped[int] = mapped_column(Integer, nullable=False)
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
     is_income: Mapped[bool] = mapped_column(Boolean, nullable=False)
     created_at: Mapped[int] = mapped_column(
-        Integer, 
-        default=lambda: int(time.time() * 1000),  # Current time in milliseconds
+        BigInteger,
+        server_default=epoch_ms(),  # Current time in milliseconds
         nullable=False
     )
     owner_id: Mapped[int] = mapped_column(
@@ -58,8 +99,14 @@ class Transaction(Base):
     
     # Relationships
     owner: Mapped["User"] = relationship("User", back_populates="transactions")
+    # Tags must be eager-loaded explicitly; lazy loads raise instead of
+    # silently emitting one SELECT per transaction.
     tags: Mapped[List["Tag"]] = relationship(
-        "Tag", back_populates="transaction", cascade="all, delete-orphan"
+        "Tag",
+        back_populates="transaction",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        order_by="Tag.id",
     )
 
 
@@ -67,6 +114,12 @@ class Tag(Base):
     """Tag model."""
     
     __tablename__ = "tags"
+    __table_args__ = (
+        # Backs tag lookups per transaction
+        Index("ix_tags_transaction_id_text", "transaction_id", "text"),
+        # Backs the tag filter, which looks up a user's tags by text
+        Index("ix_tags_user_id_text", "user_id", "text"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     text: Mapped[str] = mapped_column(String, nullable=False)
@@ -79,4 +132,12 @@ class Tag(Base):
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="tags")
-    transaction: Mapped["Transaction"] = relationship("Transaction", back_populates="tags")
\ No newline at end of file
+    transaction: Mapped["Transaction"] = relationship("Transaction", back_populates="tags")
+
+
+# The trigram index requires the pg_trgm extension
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
\ No newline at end of file
@@ -3,7 +3,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ai_worthy_api_roo_1.database.database import get_db
+from ai_worthy_api_roo_1.database.database import get_db, get_read_only_db
 from ai_worthy_api_roo_1.repositories.unit_of_work import SQLAlchemyUnitOfWork, UnitOfWorkProtocol
 from ai_worthy_api_roo_1.repositories.user_repository import SQLAlchemyUserRepository, UserRepositoryProtocol
 from ai_worthy_api_roo_1.repositories.transaction_repository import SQLAlchemyTransactionRepository, TransactionRepositoryProtocol
@@ -54,14 +54,23 @@ def get_tag_repository(db: AsyncSession = Depends(get_db)) -> TagRepositoryProto
 
 
 # Unit of Work dependency
-def get_unit_of_work() -> UnitOfWorkProtocol:
+def get_unit_of_work(
+    db: AsyncSession = Depends(get_read_only_db)
+) -> UnitOfWorkProtocol:
     """
-    Get a Unit of Work instance.
+    Get a Unit of Work instance working on the request's session.
     
+    Every Unit of Work block in a request reuses the one session and its
+    connection. The blocks commit their own writes, so the session is closed
+    without a final commit.
+    
+    Args:
+        db: The database session.
+        
     Returns:
         A Unit of Work instance.
     """
-    return SQLAlchemyUnitOfWork()
+    return SQLAlchemyUnitOfWork(session=db)
 
 
 # Service dependencies
@@ -4,18 +4,22 @@ from typing import List
 
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from ai_worthy_api_roo_1.api import auth, transactions, users
 from ai_worthy_api_roo_1.core.config import settings
-from ai_worthy_api_roo_1.database.database import engine
-from ai_worthy_api_roo_1.database.models import Base
+from ai_worthy_api_roo_1.database.database import warm_up_pool
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    # FastAPI 0.115 encodes responses with the stdlib json module by default.
+    # Later releases serialize through Pydantic and deprecate ORJSONResponse;
+    # drop this when upgrading past them.
+    default_response_class=ORJSONResponse,
 )
 
 # Set up CORS
@@ -26,15 +30,17 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Let browsers read the keyset pagination cursor cross-origin
+        expose_headers=["X-Next-Cursor"],
     )
 
 
-# Create database tables on startup
+# Warm the connection pool on startup; the schema is managed by Alembic
+# (`alembic upgrade head`), run once before the workers start
 @app.on_event("startup")
 async def startup():
-    """Create database tables on startup."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    """Warm the connection pool on startup."""
+    await warm_up_pool()
 
 
 # Include routers
@@ -1,36 +1,96 @@
 """Authentication middleware for FastAPI."""
 
-from typing import Optional
+import hashlib
+import time
+from typing import Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jwt import InvalidTokenError
 
+from ai_worthy_api_roo_1.core.cache import TTLCache
 from ai_worthy_api_roo_1.core.config import settings
-from ai_worthy_api_roo_1.database.models import User
+from ai_worthy_api_roo_1.core.security import decode_access_token
 from ai_worthy_api_roo_1.dependencies import get_user_service
 from ai_worthy_api_roo_1.schemas.auth import TokenData
+from ai_worthy_api_roo_1.schemas.user import UserOut
 from ai_worthy_api_roo_1.services.user_service import UserService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/token")
 
+# Authenticated users' profiles by ID. Users have no update path, so cached
+# profiles stay current; the balance is served by UserService.
+user_cache = TTLCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    user_service: UserService = Depends(get_user_service)
-) -> User:
+# (user_id, exp) of tokens whose signature has already been verified, keyed
+# by token_cache_key so the cache holds no usable bearer tokens
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_SIZE, ttl=settings.TOKEN_CACHE_TTL)
+
+
+def token_cache_key(token: str) -> bytes:
     """
-    Get the current authenticated user.
+    Get the token cache key for a token.
+    
+    Args:
+        token: The encoded JWT token.
+        
+    Returns:
+        The first 16 bytes of the token's SHA-256 digest.
+    """
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _verify_token(token: str) -> Tuple[int, int]:
+    """
+    Verify a token, reusing earlier verifications of the same token.
+    
+    Tokens are signed, so a token that verified once stays valid until its
+    expiry; later calls skip the signature check.
+    
+    Args:
+        token: The encoded JWT token.
+        
+    Returns:
+        The user ID and expiry timestamp from the token.
+        
+    Raises:
+        InvalidTokenError: If the token is invalid or has expired.
+        ValueError: If the subject is not a user ID.
+    """
+    key = token_cache_key(token)
+    cached = token_cache.get(key)
+    if cached is not None:
+        user_id, exp = cached
+        if exp <= time.time():
+            token_cache.pop(key)
+            raise InvalidTokenError("Signature has expired")
+        return cached
+    
+    payload = decode_access_token(token)
+    # The claims were just verified; int() is the only conversion needed
+    verified = (
+        TokenData.model_construct(user_id=int(payload["sub"])).user_id,
+        payload["exp"],
+    )
+    token_cache.set(key, verified)
+    return verified
+
+
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
+    """
+    Get the ID of the current authenticated user from the JWT alone.
+    
+    No database query is made, so endpoints that only scope data by owner
+    should prefer this over get_current_user.
     
     Args:
         token: The JWT token from the Authorization header.
-        user_service: The user service.
         
     Returns:
-        The authenticated user.
+        The authenticated user's ID.
         
     Raises:
-        HTTPException: If the token is invalid or the user doesn't exist.
+        HTTPException: If the token is invalid.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -39,21 +99,43 @@ async def get_current_user(
     )
     
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-        token_data = TokenData(user_id=int(user_id))
-    except JWTError:
+        user_id, _ = _verify_token(token)
+    except (InvalidTokenError, ValueError):
         raise credentials_exception
     
-    user = await user_service.get_user_by_id(token_data.user_id)
+    return user_id
+
+
+async def get_current_user(
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(get_user_service)
+) -> UserOut:
+    """
+    Get the current authenticated user's profile.
+    
+    FastAPI already resolves this once per request; the user cache also
+    saves the lookup across requests.
+    
+    Args:
+        user_id: The authenticated user's ID.
+        user_service: The user service.
+        
+    Returns:
+        The authenticated user's profile.
+        
+    Raises:
+        HTTPException: If the token is invalid or the user doesn't exist.
+    """
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+    
+    user = await user_service.get_user_profile(user_id)
     
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
     
+    user_cache.set(user_id, user)
     return user
\ No newline at end of file
@@ -1,8 +1,9 @@
 """Tag repository implementation."""
 
-from typing import List, Optional, Protocol
+from collections import defaultdict
+from typing import Dict, List, Optional, Protocol
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_worthy_api_roo_1.database.models import Tag
@@ -23,7 +24,24 @@ class TagRepositoryProtocol(Protocol):
         """
         ...
     
-    async def create(self, tag_text: str, user_id: int, transaction_id: int) -> Tag:
+    async def get_texts_by_transactions(
+        self, transaction_ids: List[int]
+    ) -> Dict[int, List[str]]:
+        """
+        Get tag texts for several transactions in one query.
+        
+        Args:
+            transaction_ids: The transaction IDs.
+            
+        Returns:
+            Tag texts in creation order, keyed by transaction ID. Transactions
+            without tags are absent.
+        """
+        ...
+    
+    async def create(
+        self, tag_text: str, user_id: int, transaction_id: int, flush: bool = False
+    ) -> Tag:
         """
         Create a new tag.
         
@@ -31,12 +49,27 @@ class TagRepositoryProtocol(Protocol):
             tag_text: The tag text.
             user_id: The user ID.
             transaction_id: The transaction ID.
+            flush: Whether to flush immediately, e.g. to get the generated ID.
+                Otherwise the INSERT is sent with the next flush or commit.
             
         Returns:
             The created tag.
         """
         ...
     
+    async def create_many(
+        self, tag_texts: List[str], user_id: int, transaction_id: int
+    ) -> None:
+        """
+        Create several tags for a transaction in one statement.
+        
+        Args:
+            tag_texts: The tag texts.
+            user_id: The user ID.
+            transaction_id: The transaction ID.
+        """
+        ...
+    
     async def delete_by_transaction(self, transaction_id: int) -> None:
         """
         Delete all tags for a transaction.
@@ -74,7 +107,36 @@ class SQLAlchemyTagRepository:
         )
         return result.scalars().all()
     
-    async def create(self, tag_text: str, user_id: int, transaction_id: int) -> Tag:
+    async def get_texts_by_transactions(
+        self, transaction_ids: List[int]
+    ) -> Dict[int, List[str]]:
+        """
+        Get tag texts for several transactions in one query.
+        
+        Args:
+            transaction_ids: The transaction IDs.
+            
+        Returns:
+            Tag texts in creation order, keyed by transaction ID. Transactions
+            without tags are absent.
+        """
+        if not transaction_ids:
+            return {}
+        
+        result = await self.session.execute(
+            select(Tag.transaction_id, Tag.text)
+            .where(Tag.transaction_id.in_(transaction_ids))
+            .order_by(Tag.id)
+        )
+        
+        tags: Dict[int, List[str]] = defaultdict(list)
+        for transaction_id, text in result:
+            tags[transaction_id].append(text)
+        return tags
+    
+    async def create(
+        self, tag_text: str, user_id: int, transaction_id: int, flush: bool = False
+    ) -> Tag:
         """
         Create a new tag.
         
@@ -82,6 +144,8 @@ class SQLAlchemyTagRepository:
             tag_text: The tag text.
             user_id: The user ID.
             transaction_id: The transaction ID.
+            flush: Whether to flush immediately, e.g. to get the generated ID.
+                Otherwise the INSERT is sent with the next flush or commit.
             
         Returns:
             The created tag.
@@ -93,10 +157,34 @@ class SQLAlchemyTagRepository:
         )
         
         self.session.add(new_tag)
-        await self.session.flush()
+        if flush:
+            await self.session.flush()
         
         return new_tag
     
+    async def create_many(
+        self, tag_texts: List[str], user_id: int, transaction_id: int
+    ) -> None:
+        """
+        Create several tags for a transaction in one statement.
+        
+        Args:
+            tag_texts: The tag texts.
+            user_id: The user ID.
+            transaction_id: The transaction ID.
+        """
+        if not tag_texts:
+            return
+        
+        # A Core executemany is batched into multi-row INSERTs by the dialect
+        await self.session.execute(
+            insert(Tag),
+            [
+                {"text": text, "user_id": user_id, "transaction_id": transaction_id}
+                for text in tag_texts
+            ],
+        )
+    
     async def delete_by_transaction(self, transaction_id: int) -> None:
         """
         Delete all tags for a transaction.
@@ -104,13 +192,13 @@ class SQLAlchemyTagRepository:
         Args:
             transaction_id: The transaction ID.
         """
-        result = await self.session.execute(
-            select(Tag).where(Tag.transaction_id == transaction_id)
+        # One statement for all tags; none are loaded, so there is no
+        # session state to synchronize
+        await self.session.execute(
+            delete(Tag)
+            .where(Tag.transaction_id == transaction_id)
+            .execution_options(synchronize_session=False)
         )
-        tags = result.scalars().all()
-        
-        for tag in tags:
-            await self.session.delete(tag)
 
 
 def get_tag_repository(session: AsyncSession) -> TagRepositoryProtocol:
@@ -1,15 +1,36 @@
 """Transaction repository implementation."""
 
-from typing import List, Optional, Protocol
+from typing import AsyncIterator, List, Optional, Protocol, Sequence
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import Float, Row, and_, bindparam, cast, delete, desc, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload
 
 from ai_worthy_api_roo_1.database.models import Transaction, Tag
 from ai_worthy_api_roo_1.schemas.transaction import TransactionCreate, TransactionFilter
 
 
+# Columns rendered by TransactionOut, with the amount converted from cents
+# by the database. List queries select these as plain rows, skipping ORM
+# entity construction.
+LIST_COLUMNS = (
+    Transaction.id,
+    Transaction.description,
+    Transaction.currency,
+    (cast(Transaction.amount, Float) / 100).label("amount"),
+    Transaction.is_income,
+    Transaction.created_at,
+)
+
+# Latest transactions for the home screen, built once at import
+RECENT_QUERY = (
+    select(*LIST_COLUMNS)
+    .where(Transaction.owner_id == bindparam("user_id"))
+    .order_by(desc(Transaction.created_at), desc(Transaction.id))
+    .limit(bindparam("limit"))
+)
+
+
 class TransactionRepositoryProtocol(Protocol):
     """Protocol defining the Transaction repository interface."""
     
@@ -30,7 +51,7 @@ class TransactionRepositoryProtocol(Protocol):
         self, 
         user_id: int, 
         filters: Optional[TransactionFilter] = None
-    ) -> List[Transaction]:
+    ) -> Sequence[Row]:
         """
         Get multiple transactions for a user with optional filters.
         
@@ -39,11 +60,30 @@ class TransactionRepositoryProtocol(Protocol):
             filters: Optional filters.
             
         Returns:
-            List of transactions.
+            Rows of LIST_COLUMNS, without tags.
+        """
+        ...
+    
+    def iter_multi(
+        self,
+        user_id: int,
+        filters: Optional[TransactionFilter] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream all of a user's transactions matching the filters, in batches.
+        
+        Args:
+            user_id: The user ID.
+            filters: Optional filters; pagination fields are ignored.
+            batch_size: Maximum number of rows per batch.
+            
+        Returns:
+            An async iterator over batches of LIST_COLUMNS rows, without tags.
         """
         ...
     
-    async def get_recent(self, user_id: int, limit: int = 3) -> List[Transaction]:
+    async def get_recent(self, user_id: int, limit: int = 3) -> Sequence[Row]:
         """
         Get recent transactions for a user.
         
@@ -52,7 +92,7 @@ class TransactionRepositoryProtocol(Protocol):
             limit: Maximum number of transactions to return.
             
         Returns:
-            List of recent transactions.
+            Rows of LIST_COLUMNS, without tags.
         """
         ...
     
@@ -69,7 +109,7 @@ class TransactionRepositoryProtocol(Protocol):
         """
         ...
     
-    async def delete(self, transaction_id: int, user_id: int) -> Optional[Transaction]:
+    async def delete(self, transaction_id: int, user_id: int) -> bool:
         """
         Delete a transaction.
         
@@ -78,7 +118,7 @@ class TransactionRepositoryProtocol(Protocol):
             user_id: The user ID.
             
         Returns:
-            The deleted transaction if found, None otherwise.
+            True if the transaction was deleted, False otherwise.
         """
         ...
 
@@ -108,7 +148,7 @@ class SQLAlchemyTransactionRepository:
         """
         result = await self.session.execute(
             select(Transaction)
-            .options(joinedload(Transaction.tags))
+            .options(joinedload(Transaction.tags), raiseload("*"))
             .where(
                 and_(
                     Transaction.id == transaction_id,
@@ -116,13 +156,14 @@ class SQLAlchemyTransactionRepository:
                 )
             )
         )
-        return result.scalars().first()
+        # Joined eager loading repeats the parent row per tag
+        return result.unique().scalar_one_or_none()
     
     async def get_multi(
         self, 
         user_id: int, 
         filters: Optional[TransactionFilter] = None
-    ) -> List[Transaction]:
+    ) -> Sequence[Row]:
         """
         Get multiple transactions for a user with optional filters.
         
@@ -131,62 +172,121 @@ class SQLAlchemyTransactionRepository:
             filters: Optional filters.
             
         Returns:
-            List of transactions.
+            Rows of LIST_COLUMNS, without tags.
         """
         # Default filter values
         if filters is None:
             filters = TransactionFilter()
         
+        # Base query
+        query = (
+            select(*LIST_COLUMNS)
+            .where(and_(*self._filter_conditions(user_id, filters)))
+            .order_by(desc(Transaction.created_at), desc(Transaction.id))
+            .limit(filters.per_page)
+        )
+        
+        # Fall back to offset pagination without a cursor
+        if not filters.cursor:
+            query = query.offset((filters.page - 1) * filters.per_page)
+        
+        # Execute query
+        result = await self.session.execute(query)
+        return result.all()
+    
+    async def iter_multi(
+        self,
+        user_id: int,
+        filters: Optional[TransactionFilter] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream all of a user's transactions matching the filters, in batches.
+        
+        Rows are fetched through a server-side cursor, so only one batch is
+        held in memory at a time.
+        
+        Args:
+            user_id: The user ID.
+            filters: Optional filters; pagination fields are ignored.
+            batch_size: Maximum number of rows per batch.
+            
+        Yields:
+            Batches of LIST_COLUMNS rows, without tags.
+        """
+        if filters is None:
+            filters = TransactionFilter()
+        
+        query = (
+            select(*LIST_COLUMNS)
+            .where(and_(*self._filter_conditions(user_id, filters)))
+            .order_by(desc(Transaction.created_at), desc(Transaction.id))
+            .execution_options(yield_per=batch_size)
+        )
+        
+        result = await self.session.stream(query)
+        try:
+            async for batch in result.partitions():
+                yield batch
+        finally:
+            await result.close()
+    
+    def _filter_conditions(self, user_id: int, filters: TransactionFilter) -> List:
+        """
+        Build the WHERE conditions for a user's filtered transaction list.
+        
+        Args:
+            user_id: The user ID.
+            filters: The filters.
+            
+        Returns:
+            The conditions, to be combined with AND.
+        """
         # Base query conditions
         conditions = [Transaction.owner_id == user_id]
         
-        # Add description filter if provided
+        # Add description filter if provided (case-insensitive; served by a
+        # trigram index on PostgreSQL). Wildcards typed by the user are
+        # escaped, so "_" or "%" can't turn the search into a match-all scan.
         if filters.description:
+            search = (
+                filters.description
+                .replace("\\", "\\\\")
+                .replace("%", "\\%")
+                .replace("_", "\\_")
+            )
             conditions.append(
-                Transaction.description.like(f"%{filters.description}%")
+                Transaction.description.ilike(f"%{search}%", escape="\\")
             )
         
         # Add date filters if provided
-        if filters.start_date:
+        if filters.start_date is not None:
             conditions.append(Transaction.created_at >= filters.start_date)
         
-        if filters.end_date and filters.end_date != -1:
+        # A negative end date is normalized to None by TransactionFilter
+        if filters.end_date is not None:
             conditions.append(Transaction.created_at <= filters.end_date)
         
-        # Base query
-        query = (
-            select(Transaction)
-            .where(and_(*conditions))
-            .order_by(desc(Transaction.created_at))
-            .offset((filters.page - 1) * filters.per_page)
-            .limit(filters.per_page)
-        )
-        
-        # Execute query
-        result = await self.session.execute(query)
-        transactions = result.scalars().all()
-        
-        # If tags filter is provided, we need to filter in Python
-        # since SQLAlchemy doesn't have a good way to filter by all tags
+        # Add tags filter if provided: keep only transactions that carry
+        # every requested tag, evaluated in SQL so pagination stays correct
         if filters.tags:
-            filtered_transactions = []
-            for transaction in transactions:
-                # Get tags for this transaction
-                tag_result = await self.session.execute(
-                    select(Tag.text)
-                    .where(Tag.transaction_id == transaction.id)
-                )
-                transaction_tags = tag_result.scalars().all()
-                
-                # Skip transactions that don't have all the required tags
-                if all(tag in transaction_tags for tag in filters.tags):
-                    filtered_transactions.append(transaction)
-            
-            return filtered_transactions
+            tagged_transaction_ids = (
+                select(Tag.transaction_id)
+                .where(and_(Tag.user_id == user_id, Tag.text.in_(filters.tags)))
+                .group_by(Tag.transaction_id)
+                .having(func.count(func.distinct(Tag.text)) == len(set(filters.tags)))
+            )
+            conditions.append(Transaction.id.in_(tagged_transaction_ids))
         
-        return transactions
+        # Continue after the cursor position (keyset pagination) if provided
+        if filters.cursor:
+            conditions.append(
+                tuple_(Transaction.created_at, Transaction.id) < tuple_(*filters.cursor)
+            )
+        
+        return conditions
     
-    async def get_recent(self, user_id: int, limit: int = 3) -> List[Transaction]:
+    async def get_recent(self, user_id: int, limit: int = 3) -> Sequence[Row]:
         """
         Get recent transactions for a user.
         
@@ -195,15 +295,12 @@ class SQLAlchemyTransactionRepository:
             limit: Maximum number of transactions to return.
             
         Returns:
-            List of recent transactions.
+            Rows of LIST_COLUMNS, without tags.
         """
         result = await self.session.execute(
-            select(Transaction)
-            .where(Transaction.owner_id == user_id)
-            .order_by(desc(Transaction.created_at))
-            .limit(limit)
+            RECENT_QUERY, {"user_id": user_id, "limit": limit}
         )
-        return result.scalars().all()
+        return result.all()
     
     async def create(self, transaction_data: TransactionCreate, user_id: int) -> Transaction:
         """
@@ -216,14 +313,11 @@ class SQLAlchemyTransactionRepository:
         Returns:
             The created transaction.
         """
-        # Convert amount to cents (integer) for storage
-        formatted_amount = int(transaction_data.amount * 100)
-        
         # Create new transaction
         new_transaction = Transaction(
             description=transaction_data.description,
             currency=transaction_data.currency,
-            amount=formatted_amount,
+            amount=transaction_data.amount_cents,
             is_income=transaction_data.is_income,
             owner_id=user_id
         )
@@ -233,7 +327,7 @@ class SQLAlchemyTransactionRepository:
         
         return new_transaction
     
-    async def delete(self, transaction_id: int, user_id: int) -> Optional[Transaction]:
+    async def delete(self, transaction_id: int, user_id: int) -> bool:
         """
         Delete a transaction.
         
@@ -242,18 +336,21 @@ class SQLAlchemyTransactionRepository:
             user_id: The user ID.
             
         Returns:
-            The deleted transaction if found, None otherwise.
+            True if the transaction was deleted, False otherwise.
         """
-        # Get transaction to verify ownership
-        transaction = await self.get_by_id(transaction_id, user_id)
-        
-        if not transaction:
-            return None
-        
-        # Delete transaction
-        await self.session.delete(transaction)
-        
-        return transaction
+        # Delete with ownership check; tags go through ON DELETE CASCADE
+        result = await self.session.execute(
+            delete(Transaction)
+            .where(
+                and_(
+                    Transaction.id == transaction_id,
+                    Transaction.owner_id == user_id
+                )
+            )
+            .returning(Transaction.id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.one_or_none() is not None
 
 
 def get_transaction_repository(session: AsyncSession) -> TransactionRepositoryProtocol:
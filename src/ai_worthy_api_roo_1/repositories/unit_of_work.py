@@ -1,6 +1,7 @@
 """Unit of Work pattern implementation for transaction management."""
 
-from typing import AsyncContextManager, Callable, Protocol
+import asyncio
+from typing import Any, AsyncContextManager, Awaitable, Callable, List, Optional, Protocol
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -27,20 +28,42 @@ class UnitOfWorkProtocol(Protocol):
     async def rollback(self) -> None:
         """Rollback the current transaction."""
         ...
+    
+    def read_only(self) -> "UnitOfWorkProtocol":
+        """Get a Unit of Work for reads that runs without a database transaction."""
+        ...
+    
+    async def gather_reads(
+        self, *reads: Callable[["UnitOfWorkProtocol"], Awaitable[Any]]
+    ) -> List[Any]:
+        """Run independent reads concurrently, each in its own session."""
+        ...
 
 
 class SQLAlchemyUnitOfWork:
     """SQLAlchemy implementation of the Unit of Work pattern."""
     
-    def __init__(self, session_factory: Callable[[], AsyncSession] = async_session):
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        read_only: bool = False,
+        session: Optional[AsyncSession] = None,
+    ):
         """
         Initialize the Unit of Work.
         
         Args:
             session_factory: Factory function to create a new database session.
+            read_only: Whether the block only reads, running without a database
+                transaction.
+            session: An existing session to work on instead of creating one per
+                block. The caller owns it and is responsible for closing it.
         """
         self.session_factory = session_factory
+        self.is_read_only = read_only
+        self.external_session = session
         self.session = None
+        self.autocommit = False
         
         # Repositories will be initialized in __aenter__
         self.user_repository = None
@@ -59,7 +82,25 @@ class SQLAlchemyUnitOfWork:
         from ai_worthy_api_roo_1.repositories.transaction_repository import SQLAlchemyTransactionRepository
         from ai_worthy_api_roo_1.repositories.tag_repository import SQLAlchemyTagRepository
         
-        self.session = self.session_factory()
+        if self.external_session is not None:
+            self.session = self.external_session
+        else:
+            self.session = self.session_factory()
+        
+        # Every statement in the block runs in this one database transaction,
+        # ended by a single COMMIT or ROLLBACK in __aexit__. Read-only blocks
+        # run on an AUTOCOMMIT connection instead, so the database sees no
+        # BEGIN and ending the block sends no COMMIT or ROLLBACK. A caller's
+        # session that is already in a transaction is used as it is.
+        self.autocommit = False
+        if not self.session.in_transaction():
+            if self.is_read_only:
+                await self.session.connection(
+                    execution_options={"isolation_level": "AUTOCOMMIT"}
+                )
+                self.autocommit = True
+            else:
+                await self.session.begin()
         
         # Initialize repositories with the session
         self.user_repository = SQLAlchemyUserRepository(self.session)
@@ -80,10 +121,15 @@ class SQLAlchemyUnitOfWork:
         try:
             if exc_type:
                 await self.rollback()
-            else:
+            elif not self.is_read_only or self.autocommit:
+                # On AUTOCOMMIT this only releases the connection, restoring
+                # its isolation level, without a round trip or expiring the
+                # objects already loaded
                 await self.commit()
+            # Reads inside a caller's transaction leave it open for the caller
         finally:
-            await self.session.close()
+            if self.external_session is None:
+                await self.session.close()
     
     async def commit(self) -> None:
         """Commit the current transaction."""
@@ -92,6 +138,44 @@ class SQLAlchemyUnitOfWork:
     async def rollback(self) -> None:
         """Rollback the current transaction."""
         await self.session.rollback()
+    
+    def read_only(self) -> "SQLAlchemyUnitOfWork":
+        """
+        Get a Unit of Work for reads on the same session factory.
+        
+        Each statement in it sees its own snapshot; use a regular Unit of
+        Work when several reads must agree with each other.
+        
+        Returns:
+            A new read-only Unit of Work.
+        """
+        return SQLAlchemyUnitOfWork(
+            self.session_factory, read_only=True, session=self.external_session
+        )
+    
+    async def gather_reads(
+        self, *reads: Callable[["SQLAlchemyUnitOfWork"], Awaitable[Any]]
+    ) -> List[Any]:
+        """
+        Run independent reads concurrently, each in its own session.
+        
+        Every read gets a read-only Unit of Work with a session from the
+        factory, so the reads use separate connections and overlap their
+        round trips. They do not share a transaction and may see different
+        snapshots; only use this for reads that don't depend on each other.
+        
+        Args:
+            reads: Callables taking a Unit of Work and returning an awaitable
+                of the read's result.
+                
+        Returns:
+            The results, in the order of the reads.
+        """
+        async def run(read: Callable[["SQLAlchemyUnitOfWork"], Awaitable[Any]]) -> Any:
+            async with SQLAlchemyUnitOfWork(self.session_factory, read_only=True) as uow:
+                return await read(uow)
+        
+        return list(await asyncio.gather(*(run(read) for read in reads)))
 
 
 def get_unit_of_work() -> SQLAlchemyUnitOfWork:
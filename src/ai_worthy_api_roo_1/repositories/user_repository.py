@@ -1,15 +1,49 @@
 """User repository implementation."""
 
-from typing import List, Optional, Protocol
+from typing import List, Optional, Protocol, Tuple
 
-from sqlalchemy import select, update
+from sqlalchemy import Row, bindparam, case, func, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
-from ai_worthy_api_roo_1.database.models import User
+from ai_worthy_api_roo_1.database.models import Transaction, User
 from ai_worthy_api_roo_1.schemas.auth import UserCreate
 from ai_worthy_api_roo_1.core.security import get_password_hash
 
 
+# Hot lookups are built once at import; executions only bind parameters,
+# so the statement's cache key is computed once and its compiled form reused.
+
+# Profile lookup behind every get_current_user cache miss
+PROFILE_QUERY = select(
+    User.id, User.username, User.image, User.primary_currency
+).where(User.id == bindparam("user_id"))
+
+# Login lookup
+CREDENTIALS_QUERY = select(User.id, User.password).where(
+    User.username == bindparam("username")
+)
+
+# Balance summed from the user's transactions, with the user's currency
+BALANCE_QUERY = select(
+    select(
+        func.coalesce(
+            func.sum(
+                case(
+                    (Transaction.is_income, Transaction.amount),
+                    else_=-Transaction.amount,
+                )
+            ),
+            0,
+        )
+    )
+    .where(Transaction.owner_id == User.id)
+    .scalar_subquery(),
+    User.primary_currency,
+).where(User.id == bindparam("user_id"))
+
+
 class UserRepositoryProtocol(Protocol):
     """Protocol defining the User repository interface."""
     
@@ -25,6 +59,18 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
     
+    async def get_profile(self, user_id: int) -> Optional[Row]:
+        """
+        Get the public profile columns of a user.
+        
+        Args:
+            user_id: The user ID.
+            
+        Returns:
+            A row of (id, username, image, primary_currency) if found, None otherwise.
+        """
+        ...
+    
     async def get_by_username(self, username: str) -> Optional[User]:
         """
         Get a user by username.
@@ -37,25 +83,41 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
     
-    async def create(self, user_data: UserCreate) -> User:
+    async def get_credentials(self, username: str) -> Optional[Tuple[int, str]]:
+        """
+        Get the ID and password hash for a username.
+        
+        Args:
+            username: The username.
+            
+        Returns:
+            A tuple of (id, password hash) if found, None otherwise.
+        """
+        ...
+    
+    async def create(self, user_data: UserCreate, flush: bool = False) -> User:
         """
         Create a new user.
         
         Args:
             user_data: The user data.
+            flush: Whether to flush immediately, e.g. to get the generated ID.
+                Otherwise the INSERT is sent with the next flush or commit.
             
         Returns:
             The created user.
         """
         ...
     
-    async def update_balance(self, user_id: int, new_balance: int) -> None:
+    async def create_if_not_exists(self, user_data: UserCreate) -> Optional[int]:
         """
-        Update a user's balance.
+        Create a new user unless the username is already taken.
         
         Args:
-            user_id: The user ID.
-            new_balance: The new balance.
+            user_data: The user data.
+            
+        Returns:
+            The new user's ID, or None if the username already exists.
         """
         ...
     
@@ -97,7 +159,20 @@ class SQLAlchemyUserRepository:
         result = await self.session.execute(
             select(User).where(User.id == user_id)
         )
-        return result.scalars().first()
+        return result.scalar_one_or_none()
+    
+    async def get_profile(self, user_id: int) -> Optional[Row]:
+        """
+        Get the public profile columns of a user.
+        
+        Args:
+            user_id: The user ID.
+            
+        Returns:
+            A row of (id, username, image, primary_currency) if found, None otherwise.
+        """
+        result = await self.session.execute(PROFILE_QUERY, {"user_id": user_id})
+        return result.one_or_none()
     
     async def get_by_username(self, username: str) -> Optional[User]:
         """
@@ -112,14 +187,29 @@ class SQLAlchemyUserRepository:
         result = await self.session.execute(
             select(User).where(User.username == username)
         )
-        return result.scalars().first()
+        return result.scalar_one_or_none()
     
-    async def create(self, user_data: UserCreate) -> User:
+    async def get_credentials(self, username: str) -> Optional[Tuple[int, str]]:
+        """
+        Get the ID and password hash for a username.
+        
+        Args:
+            username: The username.
+            
+        Returns:
+            A tuple of (id, password hash) if found, None otherwise.
+        """
+        result = await self.session.execute(CREDENTIALS_QUERY, {"username": username})
+        return result.one_or_none()
+    
+    async def create(self, user_data: UserCreate, flush: bool = False) -> User:
         """
         Create a new user.
         
         Args:
             user_data: The user data.
+            flush: Whether to flush immediately, e.g. to get the generated ID.
+                Otherwise the INSERT is sent with the next flush or commit.
             
         Returns:
             The created user.
@@ -129,8 +219,8 @@ class SQLAlchemyUserRepository:
         if not image:
             image = f"https://api.dicebear.com/7.x/identicon/svg?seed={user_data.username}"
         
-        # Hash password
-        hashed_password = get_password_hash(user_data.password)
+        # Hash password off the event loop
+        hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
         
         # Create new user
         new_user = User(
@@ -140,39 +230,64 @@ class SQLAlchemyUserRepository:
         )
         
         self.session.add(new_user)
-        await self.session.flush()
+        if flush:
+            await self.session.flush()
         
         return new_user
     
-    async def update_balance(self, user_id: int, new_balance: int) -> None:
+    async def create_if_not_exists(self, user_data: UserCreate) -> Optional[int]:
         """
-        Update a user's balance.
+        Create a new user unless the username is already taken.
+        
+        Uses a single INSERT ... ON CONFLICT DO NOTHING so the uniqueness
+        check and the insert cannot race.
         
         Args:
-            user_id: The user ID.
-            new_balance: The new balance.
+            user_data: The user data.
+            
+        Returns:
+            The new user's ID, or None if the username already exists.
         """
-        await self.session.execute(
-            update(User)
-            .where(User.id == user_id)
-            .values(balance=new_balance)
+        # Set default image if not provided
+        image = user_data.image
+        if not image:
+            image = f"https://api.dicebear.com/7.x/identicon/svg?seed={user_data.username}"
+        
+        # Hash password off the event loop
+        hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
+        
+        # ON CONFLICT is dialect-specific; both supported backends implement it
+        if self.session.bind.dialect.name == "postgresql":
+            insert = postgresql.insert
+        else:
+            insert = sqlite.insert
+        
+        result = await self.session.execute(
+            insert(User)
+            .values(
+                username=user_data.username,
+                password=hashed_password,
+                image=image,
+            )
+            .on_conflict_do_nothing(index_elements=[User.username])
+            .returning(User.id)
         )
+        return result.scalar_one_or_none()
     
     async def get_balance(self, user_id: int) -> Optional[tuple[int, str]]:
         """
         Get a user's balance and currency.
         
+        The balance is summed from the user's transactions in the same query.
+        
         Args:
             user_id: The user ID.
             
         Returns:
             A tuple of (balance, currency) if found, None otherwise.
         """
-        result = await self.session.execute(
-            select(User.balance, User.primary_currency)
-            .where(User.id == user_id)
-        )
-        return result.first()
+        result = await self.session.execute(BALANCE_QUERY, {"user_id": user_id})
+        return result.one_or_none()
 
 
 def get_user_repository(session: AsyncSession) -> UserRepositoryProtocol:
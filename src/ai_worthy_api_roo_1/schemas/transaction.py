@@ -1,9 +1,16 @@
 """Schemas for transaction-related operations."""
 
 from datetime import datetime
-from typing import List, Optional
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from typing import Any, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# Amounts are stored as whole cents
+CENT = Decimal("0.01")
+# Largest amount accepted, in currency units
+MAX_AMOUNT = Decimal("999999999999.99")
 
 
 class TagBase(BaseModel):
@@ -24,7 +31,41 @@ class TransactionBase(BaseModel):
 class TransactionCreate(TransactionBase):
     """Transaction creation schema."""
     
+    # Parsed as a decimal so the stored cents are exact
+    amount: Decimal = Field(ge=-MAX_AMOUNT, le=MAX_AMOUNT)
     tags: List[str] = []
+    
+    @field_validator("amount", mode="before")
+    @classmethod
+    def round_amount_to_cents(cls, amount: Any) -> Any:
+        """
+        Round the amount half-to-even to whole cents before validation.
+        
+        Float inputs such as 0.30000000000000004 are rounded, not rejected.
+        
+        Args:
+            amount: The amount as sent by the client.
+            
+        Returns:
+            The amount rounded to cents, or the input unchanged if it is not a number.
+        """
+        if isinstance(amount, bool) or not isinstance(amount, (int, float, str, Decimal)):
+            return amount
+        try:
+            return Decimal(str(amount)).quantize(CENT, rounding=ROUND_HALF_EVEN)
+        except InvalidOperation:
+            # Left to the field validation to reject
+            return amount
+    
+    @property
+    def amount_cents(self) -> int:
+        """
+        Get the amount in cents, as stored.
+        
+        Returns:
+            The amount rounded half-to-even to whole cents.
+        """
+        return int((self.amount * 100).to_integral_value(rounding=ROUND_HALF_EVEN))
 
 
 class TransactionOut(TransactionBase):
@@ -34,10 +75,7 @@ class TransactionOut(TransactionBase):
     created_at: int
     tags: List[str] = []
     
-    class Config:
-        """Pydantic config."""
-        
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TransactionFilter(BaseModel):
@@ -48,4 +86,22 @@ class TransactionFilter(BaseModel):
     description: Optional[str] = None
     tags: Optional[List[str]] = None
     start_date: Optional[int] = None
-    end_date: Optional[int] = None
\ No newline at end of file
+    end_date: Optional[int] = None
+    # Keyset pagination position as (created_at, id); takes precedence over page
+    cursor: Optional[Tuple[int, int]] = None
+    
+    @field_validator("end_date")
+    @classmethod
+    def normalize_end_date(cls, end_date: Optional[int]) -> Optional[int]:
+        """
+        Map a negative end date (the client sends -1) to no upper bound.
+        
+        Args:
+            end_date: The requested end date.
+            
+        Returns:
+            The end date, or None when unbounded.
+        """
+        if end_date is not None and end_date < 0:
+            return None
+        return end_date
\ No newline at end of file
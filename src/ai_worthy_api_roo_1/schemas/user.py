@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UserBase(BaseModel):
@@ -18,10 +18,7 @@ class UserOut(UserBase):
     id: int
     primary_currency: str
     
-    class Config:
-        """Pydantic config."""
-        
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserBalance(BaseModel):
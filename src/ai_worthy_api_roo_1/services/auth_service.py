@@ -4,14 +4,23 @@ from datetime import timedelta
 from typing import Optional
 
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
 
 from ai_worthy_api_roo_1.core.config import settings
-from ai_worthy_api_roo_1.core.security import create_access_token, verify_password
+from ai_worthy_api_roo_1.core.security import (
+    create_access_token,
+    get_dummy_password_hash,
+    verify_password,
+)
 from ai_worthy_api_roo_1.database.models import User
 from ai_worthy_api_roo_1.repositories.unit_of_work import UnitOfWorkProtocol
 from ai_worthy_api_roo_1.schemas.auth import Token, UserCreate, UserLogin
 
 
+# Settings are read once at import, so the token lifetime is fixed too
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+
 class AuthService:
     """Service for authentication-related operations."""
     
@@ -38,18 +47,15 @@ class AuthService:
             HTTPException: If the username already exists.
         """
         async with self.unit_of_work as uow:
-            # Check if username exists
-            existing_user = await uow.user_repository.get_by_username(user_data.username)
+            # Create new user; None means the username is already taken
+            user_id = await uow.user_repository.create_if_not_exists(user_data)
             
-            if existing_user:
+            if user_id is None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="User already exists",
                 )
             
-            # Create new user
-            await uow.user_repository.create(user_data)
-            
             return True
     
     async def authenticate_user(self, username: str, password: str) -> Optional[User]:
@@ -63,13 +69,60 @@ class AuthService:
         Returns:
             The authenticated user if successful, None otherwise.
         """
-        async with self.unit_of_work as uow:
+        async with self.unit_of_work.read_only() as uow:
             user = await uow.user_repository.get_by_username(username)
+        
+        if not await self._check_password(password, user.password if user else None):
+            return None
+        
+        return user
+    
+    async def authenticate_user_id(self, username: str, password: str) -> Optional[int]:
+        """
+        Authenticate a user, loading only their ID and password hash.
+        
+        Args:
+            username: The username.
+            password: The password.
             
-            if not user or not verify_password(password, user.password):
-                return None
+        Returns:
+            The authenticated user's ID if successful, None otherwise.
+        """
+        async with self.unit_of_work.read_only() as uow:
+            credentials = await uow.user_repository.get_credentials(username)
+        
+        if not await self._check_password(
+            password, credentials[1] if credentials else None
+        ):
+            return None
+        
+        return credentials[0]
+    
+    async def _check_password(self, password: str, hashed_password: Optional[str]) -> bool:
+        """
+        Check a password against a stored hash in constant time.
+        
+        bcrypt runs in the threadpool (it releases the GIL) so the event loop
+        keeps serving requests. Callers invoke this after leaving the unit of
+        work so no database connection is held meanwhile.
+        
+        Args:
+            password: The password.
+            hashed_password: The stored hash, or None if the user doesn't exist.
             
-            return user
+        Returns:
+            True if the password matches, False otherwise.
+        """
+        if hashed_password is None:
+            # Spend the same bcrypt time as a real check so response
+            # timing does not reveal whether the username exists. The dummy
+            # hash is computed (once) in the worker too, not on the event loop
+            await run_in_threadpool(
+                lambda: verify_password(password, get_dummy_password_hash())
+            )
+            return False
+        
+        return await run_in_threadpool(verify_password, password, hashed_password)
     
     async def login(self, login_data: UserLogin) -> User:
         """
@@ -104,9 +157,8 @@ class AuthService:
         Returns:
             The access token.
         """
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            subject=user_id, expires_delta=access_token_expires
+            subject=user_id, expires_delta=ACCESS_TOKEN_EXPIRES
         )
         
         return Token(access_token=access_token, token_type="bearer")
@@ -1,12 +1,58 @@
 """Transaction service implementation."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 
-from ai_worthy_api_roo_1.database.models import Transaction
 from ai_worthy_api_roo_1.repositories.unit_of_work import UnitOfWorkProtocol
 from ai_worthy_api_roo_1.schemas.transaction import TransactionCreate, TransactionFilter, TransactionOut
+from ai_worthy_api_roo_1.services.user_service import balance_cache
+
+
+def _to_transaction_out(row: Row, tags: List[str]) -> TransactionOut:
+    """
+    Convert a projected transaction row to its output schema.
+    
+    The values come straight from typed database columns, so the model is
+    built without validation. FastAPI still validates the returned models
+    against the route's response_model while serializing them, so this only
+    saves the validation at construction.
+    
+    Args:
+        row: A row of the repository's list columns.
+        tags: The transaction's tag texts.
+        
+    Returns:
+        The transaction output schema.
+    """
+    return TransactionOut.model_construct(
+        id=row.id,
+        description=row.description,
+        currency=row.currency,
+        amount=row.amount,  # Converted from cents in SQL
+        is_income=row.is_income,
+        created_at=row.created_at,
+        tags=tags,
+    )
+
+
+def _is_foreign_key_violation(error: IntegrityError) -> bool:
+    """
+    Check whether an integrity error was raised by a foreign key constraint.
+    
+    Args:
+        error: The integrity error raised by the database driver.
+        
+    Returns:
+        True for a foreign key violation, False for any other constraint.
+    """
+    # PostgreSQL reports the SQLSTATE code (23503 is foreign_key_violation)
+    if getattr(error.orig, "sqlstate", None) == "23503":
+        return True
+    # SQLite only reports the constraint kind in the message
+    return "FOREIGN KEY constraint failed" in str(error.orig)
 
 
 class TransactionService:
@@ -32,24 +78,22 @@ class TransactionService:
         Returns:
             The transaction if found, None otherwise.
         """
-        async with self.unit_of_work as uow:
+        async with self.unit_of_work.read_only() as uow:
             transaction = await uow.transaction_repository.get_by_id(transaction_id, user_id)
             
             if not transaction:
                 return None
             
-            # Get tags for this transaction
-            tags = await uow.tag_repository.get_by_transaction(transaction.id)
-            
-            # Convert to output schema
-            return TransactionOut(
+            # Convert to output schema (tags are eager-loaded by the repository);
+            # the values are trusted database columns, so skip validation
+            return TransactionOut.model_construct(
                 id=transaction.id,
                 description=transaction.description,
                 currency=transaction.currency,
                 amount=transaction.amount / 100,  # Convert from cents to dollars
                 is_income=transaction.is_income,
                 created_at=transaction.created_at,
-                tags=[tag.text for tag in tags]
+                tags=[tag.text for tag in transaction.tags]
             )
     
     async def get_transactions(
@@ -67,28 +111,39 @@ class TransactionService:
         Returns:
             List of transactions.
         """
-        async with self.unit_of_work as uow:
-            transactions = await uow.transaction_repository.get_multi(user_id, filters)
+        async with self.unit_of_work.read_only() as uow:
+            rows = await uow.transaction_repository.get_multi(user_id, filters)
+            tags = await uow.tag_repository.get_texts_by_transactions(
+                [row.id for row in rows]
+            )
             
             # Convert to output schema
-            transaction_list = []
-            for transaction in transactions:
-                # Get tags for this transaction
-                tags = await uow.tag_repository.get_by_transaction(transaction.id)
-                
-                transaction_list.append(
-                    TransactionOut(
-                        id=transaction.id,
-                        description=transaction.description,
-                        currency=transaction.currency,
-                        amount=transaction.amount / 100,  # Convert from cents to dollars
-                        is_income=transaction.is_income,
-                        created_at=transaction.created_at,
-                        tags=[tag.text for tag in tags]
-                    )
-                )
+            return [_to_transaction_out(row, tags.get(row.id, [])) for row in rows]
+    
+    async def export_transactions(
+        self,
+        user_id: int,
+        filters: Optional[TransactionFilter] = None
+    ) -> AsyncIterator[List[TransactionOut]]:
+        """
+        Stream all of a user's transactions matching the filters, in batches.
+        
+        Tags are loaded with one query per batch.
+        
+        Args:
+            user_id: The user ID.
+            filters: Optional filters; pagination fields are ignored.
             
-            return transaction_list
+        Yields:
+            Batches of transactions.
+        """
+        # Not read-only: server-side cursors need a transaction to live in
+        async with self.unit_of_work as uow:
+            async for rows in uow.transaction_repository.iter_multi(user_id, filters):
+                tags = await uow.tag_repository.get_texts_by_transactions(
+                    [row.id for row in rows]
+                )
+                yield [_to_transaction_out(row, tags.get(row.id, [])) for row in rows]
     
     async def get_recent_transactions(self, user_id: int, limit: int = 3) -> List[TransactionOut]:
         """
@@ -101,28 +156,14 @@ class TransactionService:
         Returns:
             List of recent transactions.
         """
-        async with self.unit_of_work as uow:
-            transactions = await uow.transaction_repository.get_recent(user_id, limit)
+        async with self.unit_of_work.read_only() as uow:
+            rows = await uow.transaction_repository.get_recent(user_id, limit)
+            tags = await uow.tag_repository.get_texts_by_transactions(
+                [row.id for row in rows]
+            )
             
             # Convert to output schema
-            transaction_list = []
-            for transaction in transactions:
-                # Get tags for this transaction
-                tags = await uow.tag_repository.get_by_transaction(transaction.id)
-                
-                transaction_list.append(
-                    TransactionOut(
-                        id=transaction.id,
-                        description=transaction.description,
-                        currency=transaction.currency,
-                        amount=transaction.amount / 100,  # Convert from cents to dollars
-                        is_income=transaction.is_income,
-                        created_at=transaction.created_at,
-                        tags=[tag.text for tag in tags]
-                    )
-                )
-            
-            return transaction_list
+            return [_to_transaction_out(row, tags.get(row.id, [])) for row in rows]
     
     async def create_transaction(self, transaction_data: TransactionCreate, user_id: int) -> bool:
         """
@@ -136,36 +177,31 @@ class TransactionService:
             True if the transaction was created successfully.
         """
         async with self.unit_of_work as uow:
-            # Get user to check if exists and get current balance
-            user = await uow.user_repository.get_by_id(user_id)
-            if not user:
+            # Create transaction; the balance is summed from transactions on
+            # read, so there is no user row to update
+            try:
+                new_transaction = await uow.transaction_repository.create(
+                    transaction_data, user_id
+                )
+            except IntegrityError as error:
+                # The owner foreign key is the only foreign key on the row, so
+                # its violation means the user is gone; other failures are bugs
+                if not _is_foreign_key_violation(error):
+                    raise
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="User not found",
                 )
             
-            # Create transaction
-            new_transaction = await uow.transaction_repository.create(
-                transaction_data, user_id
-            )
-            
-            # Update user balance
-            formatted_amount = int(transaction_data.amount * 100)
-            if transaction_data.is_income:
-                new_balance = user.balance + formatted_amount
-            else:
-                new_balance = user.balance - formatted_amount
-            
-            await uow.user_repository.update_balance(user_id, new_balance)
-            
             # Create tags if provided
             if transaction_data.tags:
-                for tag_text in transaction_data.tags:
-                    await uow.tag_repository.create(
-                        tag_text, user_id, new_transaction.id
-                    )
-            
-            return True
+                await uow.tag_repository.create_many(
+                    transaction_data.tags, user_id, new_transaction.id
+                )
+        
+        # Invalidate after the commit so the next read sees the new balance
+        balance_cache.pop(user_id)
+        return True
     
     async def delete_transaction(self, transaction_id: int, user_id: int) -> bool:
         """
@@ -179,35 +215,16 @@ class TransactionService:
             True if the transaction was deleted successfully, False otherwise.
         """
         async with self.unit_of_work as uow:
-            # Get transaction to verify ownership and get amount details
-            transaction = await uow.transaction_repository.get_by_id(transaction_id, user_id)
+            # Delete transaction, verifying ownership; tags go with it through
+            # the ON DELETE CASCADE foreign key
+            deleted = await uow.transaction_repository.delete(transaction_id, user_id)
             
-            if not transaction:
+            if not deleted:
                 return False
-            
-            # Get user to update balance
-            user = await uow.user_repository.get_by_id(user_id)
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="User not found",
-                )
-            
-            # Update user balance based on transaction type
-            formatted_amount = transaction.amount
-            if transaction.is_income:
-                # If income is deleted, decrease balance
-                new_balance = user.balance - formatted_amount
-            else:
-                # If expense is deleted, increase balance
-                new_balance = user.balance + formatted_amount
-            
-            await uow.user_repository.update_balance(user_id, new_balance)
-            
-            # Delete transaction
-            await uow.transaction_repository.delete(transaction_id, user_id)
-            
-            return True
+        
+        # Invalidate after the commit so the next read sees the new balance
+        balance_cache.pop(user_id)
+        return True
 
 
 def get_transaction_service(unit_of_work: UnitOfWorkProtocol) -> TransactionService:
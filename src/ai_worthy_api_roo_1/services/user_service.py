@@ -4,9 +4,15 @@ from typing import Optional
 
 from fastapi import HTTPException, status
 
-from ai_worthy_api_roo_1.database.models import User
+from ai_worthy_api_roo_1.core.cache import TTLCache
+from ai_worthy_api_roo_1.core.config import settings
 from ai_worthy_api_roo_1.repositories.unit_of_work import UnitOfWorkProtocol
-from ai_worthy_api_roo_1.schemas.user import UserBalance
+from ai_worthy_api_roo_1.schemas.user import UserBalance, UserOut
+
+# Balances by user ID; invalidated by TransactionService after each change
+balance_cache = TTLCache(
+    maxsize=settings.USER_CACHE_SIZE, ttl=settings.BALANCE_CACHE_TTL
+)
 
 
 class UserService:
@@ -21,18 +27,27 @@ class UserService:
         """
         self.unit_of_work = unit_of_work
     
-    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+    async def get_user_profile(self, user_id: int) -> Optional[UserOut]:
         """
-        Get a user by ID.
+        Get a user's public profile.
+        
+        Only the profile columns are selected; the password hash is never
+        loaded.
         
         Args:
             user_id: The user ID.
             
         Returns:
-            The user if found, None otherwise.
+            The user's profile if found, None otherwise.
         """
-        async with self.unit_of_work as uow:
-            return await uow.user_repository.get_by_id(user_id)
+        async with self.unit_of_work.read_only() as uow:
+            profile = await uow.user_repository.get_profile(user_id)
+        
+        if profile is None:
+            return None
+        
+        # Typed database columns, so skip validation
+        return UserOut.model_construct(**profile._mapping)
     
     async def get_user_balance(self, user_id: int) -> UserBalance:
         """
@@ -47,7 +62,11 @@ class UserService:
         Raises:
             HTTPException: If the user is not found.
         """
-        async with self.unit_of_work as uow:
+        cached_balance = balance_cache.get(user_id)
+        if cached_balance is not None:
+            return cached_balance
+        
+        async with self.unit_of_work.read_only() as uow:
             balance_data = await uow.user_repository.get_balance(user_id)
             
             if not balance_data:
@@ -58,11 +77,14 @@ class UserService:
             
             balance, currency = balance_data
             
-            return UserBalance(
+            user_balance = UserBalance(
                 # Convert from integer cents to float dollars
                 balance=balance / 100,
                 currency=currency
             )
+        
+        balance_cache.set(user_id, user_balance)
+        return user_balance
 
 
 def get_user_service(unit_of_work: UnitOfWorkProtocol) -> UserService:
@@ -1,16 +1,16 @@
 """Tests for the transactions API endpoints."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_worthy_api_roo_1.api.transactions import router
+from ai_worthy_api_roo_1.core.pagination import decode_cursor, encode_cursor
 from ai_worthy_api_roo_1.database.models import User
 from ai_worthy_api_roo_1.dependencies import get_transaction_service
-from ai_worthy_api_roo_1.middleware.auth import get_current_user
+from ai_worthy_api_roo_1.middleware.auth import get_current_user_id
 from ai_worthy_api_roo_1.schemas.transaction import TransactionOut
 
 
@@ -33,7 +33,6 @@ def mock_current_user():
         id=1,
         username="testuser",
         password="hashed_password",
-        balance=5000,  # $50.00 in cents
         primary_currency="USD"
     )
 
@@ -43,7 +42,7 @@ def client(mock_transaction_service, mock_current_user):
     """Create a test client with mocked dependencies."""
     # Override the dependencies
     app.dependency_overrides[get_transaction_service] = lambda: mock_transaction_service
-    app.dependency_overrides[get_current_user] = lambda: mock_current_user
+    app.dependency_overrides[get_current_user_id] = lambda: mock_current_user.id
     
     # Create the test client
     client = TestClient(app)
@@ -146,6 +145,87 @@ def test_get_transactions(client, mock_transaction_service, mock_current_user):
     # We don't check the filters in detail since they're handled by FastAPI's dependency injection
 
 
+def test_get_transactions_with_cursor(client, mock_transaction_service, mock_current_user):
+    """Test keyset pagination via the cursor query parameter and X-Next-Cursor header."""
+    # Arrange
+    mock_transactions = [
+        TransactionOut(
+            id=7,
+            description="Test transaction 7",
+            currency="USD",
+            amount=10.00,
+            is_income=True,
+            created_at=1617235200000,
+            tags=[]
+        )
+    ]
+    mock_transaction_service.get_transactions.return_value = mock_transactions
+    cursor = encode_cursor(1617235300000, 9)
+    
+    # Act
+    response = client.get(f"/transactions/?per_page=1&cursor={cursor}")
+    
+    # Assert
+    assert response.status_code == 200
+    assert decode_cursor(response.headers["X-Next-Cursor"]) == (1617235200000, 7)
+    args, _ = mock_transaction_service.get_transactions.call_args
+    assert args[1].cursor == (1617235300000, 9)
+
+
+def test_get_transactions_invalid_cursor(client, mock_transaction_service):
+    """Test that a malformed cursor is rejected."""
+    # Act
+    response = client.get("/transactions/?cursor=not-a-cursor")
+    
+    # Assert
+    assert response.status_code == 400
+    mock_transaction_service.get_transactions.assert_not_called()
+
+
+def test_export_transactions(client, mock_transaction_service, mock_current_user):
+    """Test exporting transactions as CSV."""
+    # Arrange
+    async def export_transactions(user_id, filters):
+        yield [
+            TransactionOut(
+                id=2,
+                description="Lunch, with tax",
+                currency="USD",
+                amount=12.5,
+                is_income=False,
+                created_at=1617235200000,
+                tags=["food", "work"]
+            )
+        ]
+        yield [
+            TransactionOut(
+                id=1,
+                description="Salary",
+                currency="USD",
+                amount=1000.0,
+                is_income=True,
+                created_at=1617235100000
+            )
+        ]
+    
+    mock_transaction_service.export_transactions = MagicMock(side_effect=export_transactions)
+    
+    # Act
+    response = client.get("/transactions/export", params={"tags": ["food"]})
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text.splitlines() == [
+        "id,created_at,description,amount,currency,is_income,tags",
+        '2,1617235200000,"Lunch, with tax",12.5,USD,False,food;work',
+        "1,1617235100000,Salary,1000.0,USD,True,",
+    ]
+    user_id, filters = mock_transaction_service.export_transactions.call_args.args
+    assert user_id == mock_current_user.id
+    assert filters.tags == ["food"]
+
+
 def test_create_transaction(client, mock_transaction_service, mock_current_user):
     """Test creating a transaction."""
     # Arrange
@@ -177,6 +257,28 @@ def test_create_transaction(client, mock_transaction_service, mock_current_user)
     assert args[0].tags == ["tag1", "tag2"]
 
 
+def test_create_transaction_rounds_amount(client, mock_transaction_service, mock_current_user):
+    """Test that float amounts are rounded to cents rather than rejected."""
+    # Arrange
+    mock_transaction_service.create_transaction.return_value = True
+    
+    # Act
+    response = client.post(
+        "/transactions/",
+        json={
+            "description": "Test transaction",
+            "currency": "USD",
+            "amount": 0.30000000000000004,
+            "is_income": False
+        }
+    )
+    
+    # Assert
+    assert response.status_code == 200
+    args, _ = mock_transaction_service.create_transaction.call_args
+    assert args[0].amount_cents == 30
+
+
 def test_get_transaction(client, mock_transaction_service, mock_current_user):
     """Test getting a transaction by ID."""
     # Arrange
@@ -0,0 +1,162 @@
+"""Tests for the users API endpoints."""
+
+import pytest
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from ai_worthy_api_roo_1.api.users import router
+from ai_worthy_api_roo_1.core.security import create_access_token
+from ai_worthy_api_roo_1.dependencies import get_user_service
+from ai_worthy_api_roo_1.middleware.auth import (
+    get_current_user_id, token_cache, token_cache_key, user_cache
+)
+from ai_worthy_api_roo_1.schemas.user import UserOut
+
+
+# Create a test app
+app = FastAPI()
+app.include_router(router)
+
+
+# Mock the dependencies
+@pytest.fixture
+def mock_user_service():
+    """Create a mock user service."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_current_user():
+    """Create a mock current user's profile."""
+    return UserOut(
+        id=1,
+        username="testuser",
+        image="https://example.com/image.png",
+        primary_currency="USD"
+    )
+
+
+@pytest.fixture
+def client(mock_user_service, mock_current_user):
+    """Create a test client with mocked dependencies."""
+    # Override the dependencies
+    app.dependency_overrides[get_user_service] = lambda: mock_user_service
+    app.dependency_overrides[get_current_user_id] = lambda: mock_current_user.id
+    user_cache.clear()
+    
+    # Create the test client
+    client = TestClient(app)
+    
+    yield client
+    
+    # Clean up
+    app.dependency_overrides.clear()
+    user_cache.clear()
+
+
+def test_get_current_user_info(client, mock_user_service, mock_current_user):
+    """Test getting the current user's profile."""
+    # Arrange
+    mock_user_service.get_user_profile.return_value = mock_current_user
+    
+    # Act
+    response = client.get("/users/me")
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": 1,
+        "username": "testuser",
+        "image": "https://example.com/image.png",
+        "primary_currency": "USD"
+    }
+    mock_user_service.get_user_profile.assert_called_once_with(mock_current_user.id)
+
+
+def test_get_current_user_info_is_cached(client, mock_user_service, mock_current_user):
+    """Test that the authenticated user is loaded once across requests."""
+    # Arrange
+    mock_user_service.get_user_profile.return_value = mock_current_user
+    
+    # Act
+    first = client.get("/users/me")
+    second = client.get("/users/me")
+    
+    # Assert
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    mock_user_service.get_user_profile.assert_called_once_with(mock_current_user.id)
+
+
+def test_get_current_user_info_not_found(client, mock_user_service):
+    """Test that a token for a missing user is rejected and not cached."""
+    # Arrange
+    mock_user_service.get_user_profile.return_value = None
+    
+    # Act
+    response = client.get("/users/me")
+    
+    # Assert
+    assert response.status_code == 404
+    assert user_cache.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_id_from_token():
+    """Test that a valid access token resolves to its subject."""
+    # Arrange
+    token = create_access_token(42)
+    
+    # Act
+    user_id = await get_current_user_id(token)
+    
+    # Assert
+    assert user_id == 42
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_id_expired_token():
+    """Test that an expired access token is rejected."""
+    # Arrange
+    token = create_access_token(42, expires_delta=timedelta(minutes=-1))
+    
+    # Act & Assert
+    with pytest.raises(HTTPException) as excinfo:
+        await get_current_user_id(token)
+    
+    assert excinfo.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_id_reuses_verified_token():
+    """Test that a repeated token skips signature verification."""
+    # Arrange
+    token_cache.clear()
+    token = create_access_token(42)
+    await get_current_user_id(token)
+    
+    # Act
+    with patch("ai_worthy_api_roo_1.middleware.auth.decode_access_token") as mock_decode:
+        user_id = await get_current_user_id(token)
+    
+    # Assert
+    assert user_id == 42
+    mock_decode.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_id_cached_token_expires():
+    """Test that a cached token is rejected once it expires."""
+    # Arrange
+    token_cache.clear()
+    token_cache.set(token_cache_key("expired-token"), (42, 0))
+    
+    # Act & Assert
+    with pytest.raises(HTTPException) as excinfo:
+        await get_current_user_id("expired-token")
+    
+    assert excinfo.value.status_code == 401
+    assert token_cache.get(token_cache_key("expired-token")) is None
\ No newline at end of file
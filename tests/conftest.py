@@ -0,0 +1,12 @@
+"""Shared pytest configuration."""
+
+import pytest
+from pytest_asyncio import is_async_test
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-wide event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
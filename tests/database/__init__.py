@@ -0,0 +1 @@
+"""Database tests package."""
\ No newline at end of file
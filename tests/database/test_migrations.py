@@ -0,0 +1,113 @@
+"""Tests for the Alembic migrations."""
+
+import os
+import sqlite3
+
+import pytest
+from alembic import command
+from alembic.config import Config
+
+
+ALEMBIC_INI = os.path.join(os.path.dirname(__file__), "..", "..", "alembic.ini")
+
+# The schema created by the app (through create_all) before migrations were introduced
+PRE_MIGRATIONS_SCHEMA = """
+CREATE TABLE users (
+    id INTEGER NOT NULL,
+    username VARCHAR NOT NULL,
+    password VARCHAR NOT NULL,
+    image VARCHAR NOT NULL,
+    balance INTEGER NOT NULL,
+    primary_currency VARCHAR NOT NULL,
+    PRIMARY KEY (id),
+    UNIQUE (username)
+);
+CREATE TABLE transactions (
+    id INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    currency VARCHAR NOT NULL,
+    amount INTEGER NOT NULL,
+    is_income BOOLEAN NOT NULL,
+    created_at INTEGER NOT NULL,
+    owner_id INTEGER NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(owner_id) REFERENCES users (id) ON DELETE CASCADE
+);
+CREATE TABLE tags (
+    id INTEGER NOT NULL,
+    text VARCHAR NOT NULL,
+    user_id INTEGER NOT NULL,
+    transaction_id INTEGER NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE,
+    FOREIGN KEY(transaction_id) REFERENCES transactions (id) ON DELETE CASCADE
+);
+"""
+
+
+@pytest.fixture
+def upgrade_database(tmp_path):
+    """Return a function migrating a SQLite file in tmp_path to head, and the file path."""
+    path = tmp_path / "test.db"
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("sqlalchemy.url", f"sqlite+aiosqlite:///{path}")
+    config.attributes["configure_logger"] = False
+    
+    def upgrade():
+        command.upgrade(config, "head")
+    
+    return upgrade, path
+
+
+def test_upgrade_empty_database(upgrade_database):
+    """Test migrating a new database creates the current schema."""
+    # Arrange
+    upgrade, path = upgrade_database
+    
+    # Act
+    upgrade()
+    
+    # Assert
+    with sqlite3.connect(path) as connection:
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(users)")]
+        indexes = [row[1] for row in connection.execute("PRAGMA index_list(transactions)")]
+    assert "balance" not in columns
+    assert "ix_transactions_owner_created_id" in indexes
+
+
+def test_upgrade_pre_migrations_database(upgrade_database):
+    """Test migrating a database created before migrations keeps its data."""
+    # Arrange
+    upgrade, path = upgrade_database
+    with sqlite3.connect(path) as connection:
+        connection.executescript(PRE_MIGRATIONS_SCHEMA)
+        connection.execute(
+            "INSERT INTO users (id, username, password, image, balance, primary_currency) "
+            "VALUES (1, 'testuser', 'hash', 'image.jpg', 500, 'BYN')"
+        )
+        connection.execute(
+            "INSERT INTO transactions (description, currency, amount, is_income, created_at, owner_id) "
+            "VALUES ('Salary', 'BYN', 500, 1, 1700000000000, 1)"
+        )
+    
+    # Act
+    upgrade()
+    
+    # Assert
+    with sqlite3.connect(path) as connection:
+        # New users no longer need a stored balance
+        connection.execute(
+            "INSERT INTO users (username, password, image, primary_currency) "
+            "VALUES ('newuser', 'hash', 'image.jpg', 'BYN')"
+        )
+        # created_at is filled in by the database
+        connection.execute(
+            "INSERT INTO transactions (description, currency, amount, is_income, owner_id) "
+            "VALUES ('Coffee', 'BYN', 150, 0, 1)"
+        )
+        rows = connection.execute(
+            "SELECT description, created_at FROM transactions ORDER BY id"
+        ).fetchall()
+    assert rows[0] == ("Salary", 1700000000000)
+    assert rows[1][0] == "Coffee"
+    assert rows[1][1] > 1700000000000
@@ -0,0 +1,419 @@
+"""Tests for the transaction repository."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from ai_worthy_api_roo_1.database.database import enable_sqlite_foreign_keys
+from ai_worthy_api_roo_1.database.models import Base, Tag, Transaction, User
+from ai_worthy_api_roo_1.repositories.tag_repository import SQLAlchemyTagRepository
+from ai_worthy_api_roo_1.repositories.transaction_repository import SQLAlchemyTransactionRepository
+from ai_worthy_api_roo_1.repositories.user_repository import SQLAlchemyUserRepository
+from ai_worthy_api_roo_1.schemas.transaction import TransactionCreate, TransactionFilter
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock database session."""
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    return session
+
+
+@pytest.fixture
+async def sqlite_session():
+    """Create a session on a seeded in-memory database and record its queries."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+    queries = []
+    
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record_query(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(User(id=1, username="testuser", password="hashed_password", image="image.png"))
+        for i in range(5):
+            session.add(
+                Transaction(
+                    id=i + 1,
+                    description=f"Test transaction {i}",
+                    currency="USD",
+                    amount=1000,
+                    is_income=True,
+                    created_at=1617235200000 + i,
+                    owner_id=1,
+                    tags=[Tag(text="tag1", user_id=1), Tag(text="tag2", user_id=1)],
+                )
+            )
+        await session.commit()
+        queries.clear()
+        
+        yield session, queries
+    
+    await engine.dispose()
+
+
+def get_executed_sql(mock_session):
+    """Compile the statement passed to the session's execute call."""
+    args, _ = mock_session.execute.call_args
+    return str(args[0].compile(compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.asyncio
+async def test_get_multi_date_range_includes_zero(mock_session):
+    """Test that zero is treated as a real date bound rather than omitted."""
+    # Arrange
+    repository = SQLAlchemyTransactionRepository(mock_session)
+    filters = TransactionFilter(start_date=0, end_date=0)
+    
+    # Act
+    await repository.get_multi(1, filters)
+    
+    # Assert
+    sql = get_executed_sql(mock_session)
+    assert "transactions.created_at >= 0" in sql
+    assert "transactions.created_at <= 0" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_multi_negative_end_date_is_unbounded(mock_session):
+    """Test that a negative end date adds no upper bound."""
+    # Arrange
+    repository = SQLAlchemyTransactionRepository(mock_session)
+    filters = TransactionFilter(end_date=-1)
+    
+    # Act
+    await repository.get_multi(1, filters)
+    
+    # Assert
+    assert filters.end_date is None
+    sql = get_executed_sql(mock_session)
+    assert "transactions.created_at <=" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_multi_selects_list_columns(sqlite_session):
+    """Test that listing transactions returns projected rows in one query."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTransactionRepository(session)
+    
+    # Act
+    rows = await repository.get_multi(1, TransactionFilter())
+    
+    # Assert
+    assert [row.id for row in rows] == [5, 4, 3, 2, 1]
+    assert rows[0].amount == 10.0
+    assert queries[0].startswith("SELECT transactions.id, transactions.description")
+    assert len(queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_recent_selects_list_columns(sqlite_session):
+    """Test that recent transactions are returned as projected rows in one query."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTransactionRepository(session)
+    
+    # Act
+    rows = await repository.get_recent(1)
+    
+    # Assert
+    assert [row.id for row in rows] == [5, 4, 3]
+    assert rows[0].amount == 10.0
+    assert len(queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_texts_by_transactions(sqlite_session):
+    """Test that tag texts for several transactions are grouped from one query."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTagRepository(session)
+    
+    # Act
+    tags = await repository.get_texts_by_transactions([1, 2, 99])
+    
+    # Assert
+    assert tags == {1: ["tag1", "tag2"], 2: ["tag1", "tag2"]}
+    assert len(queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_multi_tag_filter_fills_page(sqlite_session):
+    """Test that the tag filter runs before LIMIT, so pages stay full."""
+    # Arrange
+    session, queries = sqlite_session
+    for i in range(3):
+        session.add(
+            Transaction(
+                id=6 + i,
+                description=f"Newer transaction {i}",
+                currency="USD",
+                amount=1000,
+                is_income=True,
+                created_at=1617235300000 + i,
+                owner_id=1,
+                tags=[Tag(text="tag1", user_id=1), Tag(text="other", user_id=1)],
+            )
+        )
+    await session.flush()
+    queries.clear()
+    repository = SQLAlchemyTransactionRepository(session)
+    
+    # Act
+    rows = await repository.get_multi(
+        1, TransactionFilter(tags=["tag1", "tag2", "tag1"], per_page=2)
+    )
+    
+    # Assert
+    assert [row.id for row in rows] == [5, 4]
+    assert len(queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_multi_streams_batches(sqlite_session):
+    """Test that iter_multi yields every matching row in bounded batches."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTransactionRepository(session)
+    
+    # Act
+    batches = [
+        [row.id for row in batch]
+        async for batch in repository.iter_multi(
+            1, TransactionFilter(per_page=1, page=3), batch_size=2
+        )
+    ]
+    
+    # Assert
+    assert batches == [[5, 4], [3, 2], [1]]
+    assert len(queries) == 1
+    assert "LIMIT" not in queries[0]
+
+
+@pytest.mark.asyncio
+async def test_get_multi_description_escapes_wildcards(sqlite_session):
+    """Test that LIKE wildcards in the search are matched literally."""
+    # Arrange
+    session, _ = sqlite_session
+    session.add(
+        Transaction(
+            id=6,
+            description="Save 50% on_time",
+            currency="USD",
+            amount=1000,
+            is_income=False,
+            created_at=1617235300000,
+            owner_id=1,
+        )
+    )
+    await session.flush()
+    repository = SQLAlchemyTransactionRepository(session)
+    
+    # Act
+    underscore = await repository.get_multi(1, TransactionFilter(description="_"))
+    percent = await repository.get_multi(1, TransactionFilter(description="50%"))
+    text = await repository.get_multi(1, TransactionFilter(description="TEST"))
+    
+    # Assert
+    assert [row.id for row in underscore] == [6]
+    assert [row.id for row in percent] == [6]
+    assert [row.id for row in text] == [5, 4, 3, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_list_queries_read_index_in_order(sqlite_session):
+    """Test that list queries walk the owner index instead of sorting."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTransactionRepository(session)
+    await repository.get_recent(1)
+    await repository.get_multi(1, TransactionFilter(start_date=0))
+    list_queries = list(queries)
+    connection = await session.connection()
+    
+    for query in list_queries:
+        # Act
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {query}", (1,) * query.count("?")
+        )
+        plan = " ".join(row[-1] for row in result)
+        
+        # Assert
+        assert "ix_transactions_owner_created_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_get_multi_cursor_walks_all_pages(sqlite_session):
+    """Test that following the keyset cursor visits every row exactly once."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTransactionRepository(session)
+    cursor = None
+    pages = []
+    
+    # Act
+    while True:
+        rows = await repository.get_multi(1, TransactionFilter(per_page=2, cursor=cursor))
+        if not rows:
+            break
+        pages.append([row.id for row in rows])
+        cursor = (rows[-1].created_at, rows[-1].id)
+    
+    # Assert
+    assert pages == [[5, 4], [3, 2], [1]]
+    assert all(
+        "(transactions.created_at, transactions.id) < (?, ?)" in query
+        for query in queries[1:]
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_multi_reuses_compiled_statement(sqlite_session):
+    """Test that filters of the same shape hit the compiled statement cache."""
+    # Arrange
+    session, _ = sqlite_session
+    repository = SQLAlchemyTransactionRepository(session)
+    cache_stats = []
+    
+    def record_cache_stat(conn, cursor, statement, parameters, context, executemany):
+        cache_stats.append(context.cache_hit == context.dialect.CACHE_HIT)
+    
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record_cache_stat)
+    
+    # Act
+    await repository.get_multi(
+        1, TransactionFilter(description="one", tags=["tag1"], start_date=1, page=2)
+    )
+    cache_stats.clear()
+    await repository.get_multi(
+        1, TransactionFilter(description="two", tags=["tag1", "tag2"], start_date=5, page=3)
+    )
+    
+    # Assert
+    assert cache_stats == [True]
+
+
+@pytest.mark.asyncio
+async def test_create_uses_database_timestamp(sqlite_session):
+    """Test that created_at is filled by the database in the INSERT itself."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTransactionRepository(session)
+    transaction_data = TransactionCreate(
+        description="New transaction", currency="USD", amount=1.5, is_income=False
+    )
+    
+    # Act
+    transaction = await repository.create(transaction_data, 1)
+    
+    # Assert
+    assert transaction.created_at > 1617235200000
+    assert len(queries) == 1
+    assert "RETURNING" in queries[0]
+
+
+@pytest.mark.asyncio
+async def test_create_stores_exact_cents(sqlite_session):
+    """Test that amounts are converted to cents without float rounding errors."""
+    # Arrange
+    session, _ = sqlite_session
+    repository = SQLAlchemyTransactionRepository(session)
+    transaction_data = TransactionCreate(
+        description="New transaction", currency="USD", amount=0.29, is_income=False
+    )
+    
+    # Act
+    transaction = await repository.create(transaction_data, 1)
+    
+    # Assert
+    assert transaction.amount == 29
+
+
+@pytest.mark.asyncio
+async def test_get_balance_sums_transactions(sqlite_session):
+    """Test that the balance is summed from income and expenses in one query."""
+    # Arrange
+    session, queries = sqlite_session
+    session.add(
+        Transaction(
+            description="Expense", currency="USD", amount=2500, is_income=False, owner_id=1
+        )
+    )
+    await session.flush()
+    queries.clear()
+    repository = SQLAlchemyUserRepository(session)
+    
+    # Act
+    balance = await repository.get_balance(1)
+    missing = await repository.get_balance(2)
+    
+    # Assert
+    assert tuple(balance) == (5 * 1000 - 2500, "BYN")
+    assert missing is None
+    assert len(queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_cascades_to_tags(sqlite_session):
+    """Test that deleting a transaction removes its tags in the same statement."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTransactionRepository(session)
+    
+    # Act
+    deleted = await repository.delete(5, 1)
+    remaining_tags = await session.scalar(
+        select(func.count()).select_from(Tag).where(Tag.transaction_id == 5)
+    )
+    
+    # Assert
+    assert deleted is True
+    assert remaining_tags == 0
+    assert len(queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_create_many_tags_in_one_statement(sqlite_session):
+    """Test that a transaction's tags are inserted with a single statement."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTagRepository(session)
+    
+    # Act
+    await repository.create_many(["tag3", "tag4", "tag5"], 1, 1)
+    tags = await session.scalars(
+        select(Tag.text).where(Tag.transaction_id == 1).order_by(Tag.id)
+    )
+    
+    # Assert
+    assert tags.all() == ["tag1", "tag2", "tag3", "tag4", "tag5"]
+    assert len([query for query in queries if query.startswith("INSERT")]) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_by_transaction_in_one_statement(sqlite_session):
+    """Test that a transaction's tags are deleted with a single statement."""
+    # Arrange
+    session, queries = sqlite_session
+    repository = SQLAlchemyTagRepository(session)
+    
+    # Act
+    await repository.delete_by_transaction(1)
+    remaining_tags = await session.scalar(
+        select(func.count()).select_from(Tag).where(Tag.transaction_id == 1)
+    )
+    
+    # Assert
+    assert remaining_tags == 0
+    assert queries[0].startswith("DELETE FROM tags")
+    assert len(queries) == 2
\ No newline at end of file
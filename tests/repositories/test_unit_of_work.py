@@ -13,6 +13,7 @@ def mock_session_factory():
     session.commit = AsyncMock()
     session.rollback = AsyncMock()
     session.close = AsyncMock()
+    session.in_transaction = MagicMock(return_value=False)
     
     def factory():
         return session
@@ -45,6 +46,7 @@ async def test_unit_of_work_enter(mock_session_factory):
         # Assert
         assert result == uow
         assert uow.session == session
+        session.begin.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -105,6 +107,104 @@ async def test_unit_of_work_exit_exception(mock_session_factory):
         session.close.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_unit_of_work_read_only_exit(mock_session_factory):
+    """Test that a read-only Unit of Work reads without a database transaction."""
+    # Arrange
+    factory, session = mock_session_factory
+    
+    # Create the read-only Unit of Work
+    uow = SQLAlchemyUnitOfWork(factory).read_only()
+    await uow.__aenter__()
+    
+    # Act
+    await uow.__aexit__(None, None, None)
+    
+    # Assert
+    assert uow.is_read_only
+    session.begin.assert_not_called()
+    session.connection.assert_called_once_with(
+        execution_options={"isolation_level": "AUTOCOMMIT"}
+    )
+    session.commit.assert_called_once()  # Releases the AUTOCOMMIT connection
+    session.rollback.assert_not_called()
+    session.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_external_session(mock_session_factory):
+    """Test that a Unit of Work on a caller's session leaves it open."""
+    # Arrange
+    _, session = mock_session_factory
+    factory = MagicMock()
+    
+    # Create the Unit of Work on the existing session
+    uow = SQLAlchemyUnitOfWork(factory, session=session)
+    
+    # Act
+    await uow.__aenter__()
+    await uow.__aexit__(None, None, None)
+    
+    # Assert
+    assert uow.session == session
+    factory.assert_not_called()
+    session.begin.assert_called_once()
+    session.commit.assert_called_once()
+    session.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_external_session_in_transaction(mock_session_factory):
+    """Test that a shared session's open transaction is reused."""
+    # Arrange
+    _, session = mock_session_factory
+    session.in_transaction.return_value = True
+    
+    # Create a read-only Unit of Work on the existing session
+    uow = SQLAlchemyUnitOfWork(session=session).read_only()
+    
+    # Act
+    await uow.__aenter__()
+    await uow.__aexit__(None, None, None)
+    
+    # Assert
+    assert uow.session == session
+    session.begin.assert_not_called()
+    session.commit.assert_not_called()
+    session.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_gather_reads():
+    """Test that gathered reads each run in their own read-only session."""
+    # Arrange
+    sessions = []
+    
+    def factory():
+        session = AsyncMock()
+        session.in_transaction = MagicMock(return_value=False)
+        sessions.append(session)
+        return session
+    
+    uow = SQLAlchemyUnitOfWork(factory)
+    
+    async def read_session(read_uow):
+        return read_uow.session
+    
+    async def read_constant(read_uow):
+        return 42
+    
+    # Act
+    result = await uow.gather_reads(read_session, read_constant)
+    
+    # Assert
+    assert result == [sessions[0], 42]
+    assert len(sessions) == 2
+    for session in sessions:
+        session.begin.assert_not_called()
+        session.close.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_unit_of_work_commit(mock_session_factory):
     """Test committing the Unit of Work."""
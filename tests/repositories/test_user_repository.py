@@ -28,7 +28,7 @@ async def test_get_by_id(mock_session):
     user_id = 1
     mock_user = User(id=user_id, username="testuser", password="hashed_password")
     mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = mock_user
+    mock_result.scalar_one_or_none.return_value = mock_user
     mock_session.execute.return_value = mock_result
     
     repository = SQLAlchemyUserRepository(mock_session)
@@ -48,7 +48,7 @@ async def test_get_by_username(mock_session):
     username = "testuser"
     mock_user = User(id=1, username=username, password="hashed_password")
     mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = mock_user
+    mock_result.scalar_one_or_none.return_value = mock_user
     mock_session.execute.return_value = mock_result
     
     repository = SQLAlchemyUserRepository(mock_session)
@@ -61,6 +61,24 @@ async def test_get_by_username(mock_session):
     mock_session.execute.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_credentials(mock_session):
+    """Test getting a user's ID and password hash by username."""
+    # Arrange
+    mock_result = MagicMock()
+    mock_result.one_or_none.return_value = (1, "hashed_password")
+    mock_session.execute.return_value = mock_result
+    
+    repository = SQLAlchemyUserRepository(mock_session)
+    
+    # Act
+    result = await repository.get_credentials("testuser")
+    
+    # Assert
+    assert result == (1, "hashed_password")
+    mock_session.execute.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_create(mock_session):
     """Test creating a user."""
@@ -85,23 +103,45 @@ async def test_create(mock_session):
         assert result.password == "hashed_password"
         assert result.image == user_data.image
         mock_session.add.assert_called_once()
-        mock_session.flush.assert_called_once()
+        mock_session.flush.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_update_balance(mock_session):
-    """Test updating a user's balance."""
+async def test_create_flush(mock_session):
+    """Test creating a user with an immediate flush."""
     # Arrange
-    user_id = 1
-    new_balance = 1000
+    user_data = UserCreate(username="testuser", password="password123")
+    
+    repository = SQLAlchemyUserRepository(mock_session)
+    
+    with patch("ai_worthy_api_roo_1.repositories.user_repository.get_password_hash"):
+        # Act
+        await repository.create(user_data, flush=True)
+    
+    # Assert
+    mock_session.flush.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_if_not_exists(mock_session):
+    """Test creating a user with a single conflict-aware insert."""
+    # Arrange
+    user_data = UserCreate(username="testuser", password="password123")
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = 1
+    mock_session.execute.return_value = mock_result
     
     repository = SQLAlchemyUserRepository(mock_session)
     
     # Act
-    await repository.update_balance(user_id, new_balance)
+    with patch("ai_worthy_api_roo_1.repositories.user_repository.get_password_hash") as mock_hash:
+        mock_hash.return_value = "hashed_password"
+        result = await repository.create_if_not_exists(user_data)
     
     # Assert
+    assert result == 1
     mock_session.execute.assert_called_once()
+    mock_session.add.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -114,7 +154,7 @@ async def test_get_balance(mock_session):
     
     # Configure the mock to return the expected value
     mock_result = MagicMock()
-    mock_result.first.return_value = (balance, currency)
+    mock_result.one_or_none.return_value = (balance, currency)
     mock_session.execute.return_value = mock_result
     
     repository = SQLAlchemyUserRepository(mock_session)
@@ -0,0 +1,94 @@
+"""Tests for the auth service."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import HTTPException
+
+from ai_worthy_api_roo_1.database.models import User
+from ai_worthy_api_roo_1.services.auth_service import AuthService
+from ai_worthy_api_roo_1.schemas.auth import UserCreate, UserLogin
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    """Create a mock unit of work."""
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    uow.read_only = MagicMock(return_value=uow)
+    uow.user_repository = AsyncMock()
+    return uow
+
+
+@pytest.mark.asyncio
+async def test_register_user_already_exists(mock_unit_of_work):
+    """Test registering a username that is already taken."""
+    # Arrange
+    user_data = UserCreate(username="testuser", password="password123")
+    mock_unit_of_work.user_repository.create_if_not_exists.return_value = None
+    
+    service = AuthService(mock_unit_of_work)
+    
+    # Act & Assert
+    with pytest.raises(HTTPException) as excinfo:
+        await service.register_user(user_data)
+    
+    assert excinfo.value.status_code == 400
+    mock_unit_of_work.user_repository.get_by_username.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_unknown_username(mock_unit_of_work):
+    """Test that an unknown username still performs a password check."""
+    # Arrange
+    mock_unit_of_work.user_repository.get_by_username.return_value = None
+    
+    service = AuthService(mock_unit_of_work)
+    
+    # Act
+    with patch("ai_worthy_api_roo_1.services.auth_service.verify_password") as mock_verify, \
+         patch("ai_worthy_api_roo_1.services.auth_service.get_dummy_password_hash") as mock_dummy:
+        mock_dummy.return_value = "dummy_hash"
+        result = await service.authenticate_user("nobody", "password123")
+    
+    # Assert
+    assert result is None
+    mock_verify.assert_called_once_with("password123", "dummy_hash")
+
+
+@pytest.mark.asyncio
+async def test_login_wrong_password(mock_unit_of_work):
+    """Test logging in with an incorrect password."""
+    # Arrange
+    mock_user = User(id=1, username="testuser", password="hashed_password")
+    mock_unit_of_work.user_repository.get_by_username.return_value = mock_user
+    
+    service = AuthService(mock_unit_of_work)
+    
+    # Act & Assert
+    with patch("ai_worthy_api_roo_1.services.auth_service.verify_password") as mock_verify:
+        mock_verify.return_value = False
+        with pytest.raises(HTTPException) as excinfo:
+            await service.login(UserLogin(username="testuser", password="wrong"))
+    
+    assert excinfo.value.status_code == 401
+    mock_verify.assert_called_once_with("wrong", "hashed_password")
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_id(mock_unit_of_work):
+    """Test authenticating with the projected credentials query."""
+    # Arrange
+    mock_unit_of_work.user_repository.get_credentials.return_value = (1, "hashed_password")
+    
+    service = AuthService(mock_unit_of_work)
+    
+    # Act
+    with patch("ai_worthy_api_roo_1.services.auth_service.verify_password") as mock_verify:
+        mock_verify.return_value = True
+        result = await service.authenticate_user_id("testuser", "password123")
+    
+    # Assert
+    assert result == 1
+    mock_verify.assert_called_once_with("password123", "hashed_password")
+    mock_unit_of_work.user_repository.get_by_username.assert_not_called()
\ No newline at end of file
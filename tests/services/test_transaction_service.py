@@ -1,9 +1,13 @@
 """Tests for the transaction service."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
-from ai_worthy_api_roo_1.database.models import Transaction, User, Tag
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+
+from ai_worthy_api_roo_1.core.cache import TTLCache
+from ai_worthy_api_roo_1.database.models import Transaction, Tag
 from ai_worthy_api_roo_1.services.transaction_service import TransactionService
 from ai_worthy_api_roo_1.schemas.transaction import TransactionCreate, TransactionFilter, TransactionOut
 
@@ -13,7 +17,7 @@ def mock_unit_of_work():
     """Create a mock unit of work."""
     uow = AsyncMock()
     uow.__aenter__.return_value = uow
-    uow.__aexit__.return_value = None
+    uow.read_only = MagicMock(return_value=uow)
     uow.transaction_repository = AsyncMock()
     uow.user_repository = AsyncMock()
     uow.tag_repository = AsyncMock()
@@ -35,46 +39,39 @@ def mock_transaction():
 
 
 @pytest.fixture
-def mock_user():
-    """Create a mock user."""
-    return User(
+def expected_transaction_out():
+    """Create the output expected for mock_transaction with one tag."""
+    return TransactionOut(
         id=1,
-        username="testuser",
-        password="hashed_password",
-        balance=5000,  # $50.00 in cents
-        primary_currency="USD"
+        description="Test transaction",
+        currency="USD",
+        amount=10.0,  # Converted from cents
+        is_income=True,
+        created_at=1617235200000,
+        tags=["tag1"]
     )
 
 
 @pytest.mark.asyncio
-async def test_get_transaction(mock_unit_of_work, mock_transaction):
+async def test_get_transaction(mock_unit_of_work, mock_transaction, expected_transaction_out):
     """Test getting a transaction by ID."""
     # Arrange
     transaction_id = 1
     user_id = 1
+    # Tags are eager-loaded onto the transaction by the repository
+    mock_transaction.tags = [Tag(id=1, text="tag1", user_id=user_id, transaction_id=transaction_id)]
     mock_unit_of_work.transaction_repository.get_by_id.return_value = mock_transaction
     
-    # Mock tags
-    mock_tags = [Tag(id=1, text="tag1", user_id=user_id, transaction_id=transaction_id)]
-    mock_unit_of_work.tag_repository.get_by_transaction.return_value = mock_tags
-    
     service = TransactionService(mock_unit_of_work)
     
     # Act
     result = await service.get_transaction(transaction_id, user_id)
     
     # Assert
-    assert isinstance(result, TransactionOut)
-    assert result.id == mock_transaction.id
-    assert result.description == mock_transaction.description
-    assert result.currency == mock_transaction.currency
-    assert result.amount == mock_transaction.amount / 100  # Check conversion from cents to dollars
-    assert result.is_income == mock_transaction.is_income
-    assert result.created_at == mock_transaction.created_at
-    assert result.tags == ["tag1"]
+    assert result == expected_transaction_out
     
     mock_unit_of_work.transaction_repository.get_by_id.assert_called_once_with(transaction_id, user_id)
-    mock_unit_of_work.tag_repository.get_by_transaction.assert_called_once_with(transaction_id)
+    mock_unit_of_work.tag_repository.get_by_transaction.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -97,16 +94,24 @@ async def test_get_transaction_not_found(mock_unit_of_work):
 
 
 @pytest.mark.asyncio
-async def test_get_transactions(mock_unit_of_work, mock_transaction):
+async def test_get_transactions(mock_unit_of_work, mock_transaction, expected_transaction_out):
     """Test getting transactions with filters."""
     # Arrange
     user_id = 1
     filters = TransactionFilter(page=1, per_page=10)
-    mock_unit_of_work.transaction_repository.get_multi.return_value = [mock_transaction]
-    
-    # Mock tags
-    mock_tags = [Tag(id=1, text="tag1", user_id=user_id, transaction_id=mock_transaction.id)]
-    mock_unit_of_work.tag_repository.get_by_transaction.return_value = mock_tags
+    # The repository returns projected rows with the amount already converted
+    row = MagicMock(
+        id=mock_transaction.id,
+        description=mock_transaction.description,
+        currency=mock_transaction.currency,
+        amount=10.0,
+        is_income=mock_transaction.is_income,
+        created_at=mock_transaction.created_at,
+    )
+    mock_unit_of_work.transaction_repository.get_multi.return_value = [row]
+    mock_unit_of_work.tag_repository.get_texts_by_transactions.return_value = {
+        mock_transaction.id: ["tag1"]
+    }
     
     service = TransactionService(mock_unit_of_work)
     
@@ -114,17 +119,17 @@ async def test_get_transactions(mock_unit_of_work, mock_transaction):
     result = await service.get_transactions(user_id, filters)
     
     # Assert
-    assert len(result) == 1
-    assert isinstance(result[0], TransactionOut)
-    assert result[0].id == mock_transaction.id
-    assert result[0].tags == ["tag1"]
+    assert result == [expected_transaction_out]
     
     mock_unit_of_work.transaction_repository.get_multi.assert_called_once_with(user_id, filters)
-    mock_unit_of_work.tag_repository.get_by_transaction.assert_called_once_with(mock_transaction.id)
+    mock_unit_of_work.tag_repository.get_texts_by_transactions.assert_called_once_with(
+        [mock_transaction.id]
+    )
+    mock_unit_of_work.tag_repository.get_by_transaction.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_create_transaction(mock_unit_of_work, mock_user):
+async def test_create_transaction(mock_unit_of_work):
     """Test creating a transaction."""
     # Arrange
     user_id = 1
@@ -145,7 +150,6 @@ async def test_create_transaction(mock_unit_of_work, mock_user):
         owner_id=user_id
     )
     
-    mock_unit_of_work.user_repository.get_by_id.return_value = mock_user
     mock_unit_of_work.transaction_repository.create.return_value = mock_transaction
     
     service = TransactionService(mock_unit_of_work)
@@ -156,21 +160,22 @@ async def test_create_transaction(mock_unit_of_work, mock_user):
     # Assert
     assert result is True
     
-    mock_unit_of_work.user_repository.get_by_id.assert_called_once_with(user_id)
-    mock_unit_of_work.transaction_repository.create.assert_called_once()
-    mock_unit_of_work.user_repository.update_balance.assert_called_once()
-    assert mock_unit_of_work.tag_repository.create.call_count == 2  # Two tags
+    # The transaction is inserted before its tags; the balance is summed from
+    # transactions, so the user row isn't touched
+    assert mock_unit_of_work.method_calls == [
+        call.transaction_repository.create(transaction_data, user_id),
+        call.tag_repository.create_many(["tag1", "tag2"], user_id, mock_transaction.id),
+    ]
 
 
 @pytest.mark.asyncio
-async def test_delete_transaction(mock_unit_of_work, mock_transaction, mock_user):
+async def test_delete_transaction(mock_unit_of_work, mock_transaction):
     """Test deleting a transaction."""
     # Arrange
     transaction_id = 1
     user_id = 1
     
-    mock_unit_of_work.transaction_repository.get_by_id.return_value = mock_transaction
-    mock_unit_of_work.user_repository.get_by_id.return_value = mock_user
+    mock_unit_of_work.transaction_repository.delete.return_value = True
     
     service = TransactionService(mock_unit_of_work)
     
@@ -180,7 +185,94 @@ async def test_delete_transaction(mock_unit_of_work, mock_transaction, mock_user
     # Assert
     assert result is True
     
-    mock_unit_of_work.transaction_repository.get_by_id.assert_called_once_with(transaction_id, user_id)
-    mock_unit_of_work.user_repository.get_by_id.assert_called_once_with(user_id)
-    mock_unit_of_work.user_repository.update_balance.assert_called_once()
-    mock_unit_of_work.transaction_repository.delete.assert_called_once_with(transaction_id, user_id)
\ No newline at end of file
+    mock_unit_of_work.transaction_repository.delete.assert_called_once_with(transaction_id, user_id)
+    mock_unit_of_work.tag_repository.delete_by_transaction.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_transaction_not_found(mock_unit_of_work):
+    """Test deleting a transaction that doesn't exist."""
+    # Arrange
+    transaction_id = 1
+    user_id = 1
+    mock_unit_of_work.transaction_repository.delete.return_value = False
+    
+    service = TransactionService(mock_unit_of_work)
+    
+    # Act
+    result = await service.delete_transaction(transaction_id, user_id)
+    
+    # Assert
+    assert result is False
+    mock_unit_of_work.transaction_repository.delete.assert_called_once_with(transaction_id, user_id)
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_invalidates_balance_cache(mock_unit_of_work):
+    """Test that creating a transaction drops the user's cached balance."""
+    # Arrange
+    user_id = 1
+    transaction_data = TransactionCreate(
+        description="Test transaction",
+        currency="USD",
+        amount=10.00,
+        is_income=True
+    )
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set(user_id, "stale balance")
+    
+    service = TransactionService(mock_unit_of_work)
+    
+    # Act
+    with patch("ai_worthy_api_roo_1.services.transaction_service.balance_cache", cache):
+        await service.create_transaction(transaction_data, user_id)
+    
+    # Assert
+    assert cache.get(user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_user_not_found(mock_unit_of_work):
+    """Test creating a transaction for a user that no longer exists."""
+    # Arrange
+    transaction_data = TransactionCreate(
+        description="Test transaction",
+        currency="USD",
+        amount=10.00,
+        is_income=True
+    )
+    mock_unit_of_work.transaction_repository.create.side_effect = IntegrityError(
+        "INSERT INTO transactions", {}, Exception("FOREIGN KEY constraint failed")
+    )
+    
+    service = TransactionService(mock_unit_of_work)
+    
+    # Act & Assert
+    with pytest.raises(HTTPException) as excinfo:
+        await service.create_transaction(transaction_data, 99)
+    
+    assert excinfo.value.status_code == 404
+    mock_unit_of_work.tag_repository.create_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_other_integrity_error(mock_unit_of_work):
+    """Test that integrity errors other than a missing owner are not reported as 404."""
+    # Arrange
+    transaction_data = TransactionCreate(
+        description="Test transaction",
+        currency="USD",
+        amount=10.00,
+        is_income=True
+    )
+    mock_unit_of_work.transaction_repository.create.side_effect = IntegrityError(
+        "INSERT INTO transactions", {}, Exception("NOT NULL constraint failed: transactions.created_at")
+    )
+    
+    service = TransactionService(mock_unit_of_work)
+    
+    # Act & Assert
+    with pytest.raises(IntegrityError):
+        await service.create_transaction(transaction_data, 1)
+    
+    mock_unit_of_work.tag_repository.create_many.assert_not_called()
@@ -5,9 +5,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import HTTPException
 
-from ai_worthy_api_roo_1.database.models import User
+from ai_worthy_api_roo_1.core.cache import TTLCache
 from ai_worthy_api_roo_1.services.user_service import UserService
-from ai_worthy_api_roo_1.schemas.user import UserBalance
+from ai_worthy_api_roo_1.schemas.user import UserBalance, UserOut
 
 
 @pytest.fixture
@@ -15,44 +15,36 @@ def mock_unit_of_work():
     """Create a mock unit of work."""
     uow = AsyncMock()
     uow.__aenter__.return_value = uow
-    uow.__aexit__.return_value = None
+    uow.read_only = MagicMock(return_value=uow)
     uow.user_repository = AsyncMock()
     return uow
 
 
 @pytest.mark.asyncio
-async def test_get_user_by_id(mock_unit_of_work):
-    """Test getting a user by ID."""
+async def test_get_user_profile(mock_unit_of_work):
+    """Test getting a user's profile from the projected columns."""
     # Arrange
     user_id = 1
-    mock_user = User(id=user_id, username="testuser", password="hashed_password")
-    mock_unit_of_work.user_repository.get_by_id.return_value = mock_user
+    profile = MagicMock(
+        _mapping={
+            "id": user_id,
+            "username": "testuser",
+            "image": "image.png",
+            "primary_currency": "USD",
+        }
+    )
+    mock_unit_of_work.user_repository.get_profile.return_value = profile
     
     service = UserService(mock_unit_of_work)
     
     # Act
-    result = await service.get_user_by_id(user_id)
+    result = await service.get_user_profile(user_id)
     
     # Assert
-    assert result == mock_user
-    mock_unit_of_work.user_repository.get_by_id.assert_called_once_with(user_id)
-
-
-@pytest.mark.asyncio
-async def test_get_user_by_id_not_found(mock_unit_of_work):
-    """Test getting a user by ID when the user doesn't exist."""
-    # Arrange
-    user_id = 1
-    mock_unit_of_work.user_repository.get_by_id.return_value = None
-    
-    service = UserService(mock_unit_of_work)
-    
-    # Act
-    result = await service.get_user_by_id(user_id)
-    
-    # Assert
-    assert result is None
-    mock_unit_of_work.user_repository.get_by_id.assert_called_once_with(user_id)
+    assert isinstance(result, UserOut)
+    assert result.model_dump() == profile._mapping
+    mock_unit_of_work.user_repository.get_profile.assert_called_once_with(user_id)
+    mock_unit_of_work.user_repository.get_by_id.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -91,4 +83,23 @@ async def test_get_user_balance_not_found(mock_unit_of_work):
     
     assert excinfo.value.status_code == 404
     assert excinfo.value.detail == "User not found"
+    mock_unit_of_work.user_repository.get_balance.assert_called_once_with(user_id)
+
+
+@pytest.mark.asyncio
+async def test_get_user_balance_cached(mock_unit_of_work):
+    """Test that a cached balance is served without a query."""
+    # Arrange
+    user_id = 1
+    mock_unit_of_work.user_repository.get_balance.return_value = (1000, "USD")
+    
+    service = UserService(mock_unit_of_work)
+    
+    # Act
+    with patch("ai_worthy_api_roo_1.services.user_service.balance_cache", TTLCache(maxsize=10, ttl=60)):
+        first = await service.get_user_balance(user_id)
+        second = await service.get_user_balance(user_id)
+    
+    # Assert
+    assert second == first
     mock_unit_of_work.user_repository.get_balance.assert_called_once_with(user_id)
\ No newline at end of file